@@ -1,12 +1,17 @@
+import asyncio
+import itertools
 import os
 import sqlite3
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from jobfuq.logger.logger import logger
 
 SQL_QUERIES: Dict[str, str] = {}
+# Memory-map up to 256 MiB of the database so hot pages are read without a syscall each.
+MMAP_SIZE: int = 256 * 1024 * 1024
 
 def load_sql_queries() -> Dict[str, str]:
     """
@@ -29,22 +34,43 @@ def load_sql_queries() -> Dict[str, str]:
                 SQL_QUERIES[key] = f.read().strip()
     return SQL_QUERIES
 
-def create_connection(config: Dict[str, Any]) -> sqlite3.Connection:
+def create_connection(config: Dict[str, Any], check_same_thread: bool = True) -> sqlite3.Connection:
     """
-    Create a SQLite database connection based on the provided config.
+    Create a SQLite database connection based on the provided config. Pass
+    check_same_thread=False for a connection that a writer drives from worker threads.
     """
     db_path: str = config.get("db_path", "data/test_job_listings.db")
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    return sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+    # WAL lets readers proceed while the score writer commits.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn
+
+def create_read_connection(config: Dict[str, Any]) -> sqlite3.Connection:
+    """
+    Create a read-only connection for streaming candidate rows from a worker thread, so reads
+    never queue behind the writer's connection. It may be used from any thread, but only by
+    one thread at a time. Tables it reads must already exist (see create_candidate_tables).
+    """
+    conn = sqlite3.connect(config.get("db_path", "data/test_job_listings.db"), check_same_thread=False)
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn
 
 def create_table(conn: sqlite3.Connection) -> None:
     """
     Create the job_listings table (if not exists) using the associated SQL query.
     The table now includes a column "scoring_model" for tracking which AI model was used.
+    The side tables the scoring passes read are created along with it.
     """
     q: str = load_sql_queries()["create_job_listings_table"]
     conn.execute(q)
     conn.commit()
+    create_candidate_tables(conn)
 
 def create_blacklist_table(conn: sqlite3.Connection) -> None:
     """
@@ -64,21 +90,70 @@ def create_blacklisted_companies_table(conn: sqlite3.Connection) -> None:
     conn.commit()
     logger.info("Blacklisted companies table verified.")
 
-def load_blacklist(conn: sqlite3.Connection) -> Dict[str, set]:
+def create_poison_jobs_table(conn: sqlite3.Connection) -> None:
+    """
+    Create the poison_jobs table (if not exists) listing jobs that can never be evaluated.
+    """
+    q: str = load_sql_queries()["create_poison_jobs_table"]
+    conn.execute(q)
+    conn.commit()
+
+def mark_poison(conn: sqlite3.Connection, job_id: Any, reason: str) -> None:
+    """
+    Exclude a job from all future scoring and rescoring passes. The poison_jobs table must
+    already exist (see create_candidate_tables).
+    """
+    q: str = load_sql_queries()["mark_poison"]
+    try:
+        conn.execute(q, (job_id, reason, int(time.time())))
+        conn.commit()
+    except Exception as e:
+        logger.error("Mark poison error: %s", e)
+
+def create_job_retry_table(conn: sqlite3.Connection) -> None:
+    """
+    Create the job_retry table (if not exists) holding the retry schedule of failed jobs, so
+    held jobs stay out of the candidate queries across restarts.
+    """
+    q: str = load_sql_queries()["create_job_retry_table"]
+    conn.execute(q)
+    conn.commit()
+
+def get_retry_counts(conn: sqlite3.Connection, job_id: Any) -> Tuple[int, int]:
+    """
+    Return (attempts, failures) for a job since its last success: how many times it was
+    scheduled for retry, and how many of those were failures that count toward poisoning.
+    The job_retry table must already exist (see create_candidate_tables).
+    """
+    row = conn.execute(load_sql_queries()["get_retry_counts"], (job_id,)).fetchone()
+    return (row[0], row[1]) if row else (0, 0)
+
+def schedule_job_retry(conn: sqlite3.Connection, job_id: Any, delay: float, counts_failure: bool = True) -> None:
+    """
+    Hold a job out of candidate queries for `delay` seconds and count the attempt, and the
+    failure too unless `counts_failure` is False. The job_retry table must already exist
+    (see create_candidate_tables).
+    """
+    q: str = load_sql_queries()["schedule_job_retry"]
+    try:
+        conn.execute(q, (job_id, time.time() + delay, int(counts_failure)))
+        conn.commit()
+    except Exception as e:
+        logger.error("Schedule retry error: %s", e)
+
+EMPTY_BLACKLIST: Dict[str, FrozenSet[str]] = {"blacklist": frozenset(), "whitelist": frozenset()}
+
+def load_blacklist(conn: sqlite3.Connection) -> Dict[str, FrozenSet[str]]:
     """
-    Return a dictionary with two sets: {'blacklist': set(...), 'whitelist': set(...)}.
+    Return a dictionary with two frozensets: {'blacklist': ..., 'whitelist': ...}.
+    They are read-only, so one loaded copy can be shared by every scraper and task.
     """
     q: str = load_sql_queries()["load_blacklist"]
-    c = conn.execute(q)
     r: Dict[str, set] = {"blacklist": set(), "whitelist": set()}
-    for row in c.fetchall():
-        t: str = row[0].strip().lower()
-        v: str = row[1].strip()
-        if t in r:
-            r[t].add(v)
-        else:
-            r["blacklist"].add(v)
-    return r
+    for t, v in conn.execute(q):
+        t = t.strip().lower()
+        r[t if t in r else "blacklist"].add(v.strip())
+    return {k: frozenset(v) for k, v in r.items()}
 
 def is_company_blacklisted(conn: sqlite3.Connection, company_name: str, company_url: str) -> bool:
     """
@@ -118,18 +193,13 @@ def insert_job(conn: sqlite3.Connection, job: Dict[str, Any]) -> None:
     try:
         conn.execute(q, params)
         conn.commit()
-        logger.debug(f"Inserted job {job['job_url']}")
+        logger.debug("Inserted job %s", job['job_url'])
     except Exception as e:
-        logger.error(f"Insert error: {e}")
+        logger.error("Insert error: %s", e)
 
 
-def insert_job_minimal(conn: sqlite3.Connection, job: dict) -> None:
-    """
-    Insert a job listing into job_listings with only minimal fields (title and job_url).
-    Other fields are set to default values.
-    """
-    q: str = load_sql_queries()["insert_job"]
-    params = (
+def _minimal_job_params(job: dict, today: str, now_ms: int) -> Tuple[Any, ...]:
+    return (
         job.get("title", "No Title"),
         job.get("company", "No Company"),
         job.get("company_url", ""),
@@ -140,109 +210,379 @@ def insert_job_minimal(conn: sqlite3.Connection, job: dict) -> None:
         job.get("company_size", "Unknown"),
         job.get("company_size_score", 0),
         job.get("job_url", ""),
-        job.get("date", datetime.now().strftime('%Y-%m-%d')),
-        job.get("listed_at", int(time.time() * 1000)),
-        None,  # applicants_count
+        job.get("date", today),
+        job.get("listed_at", now_ms),
+        job.get("applicants_count"),
         0.0,   # overall_relevance
         1,     # is_posted
         "not applied",
     )
+
+def bulk_insert_jobs_minimal(conn: sqlite3.Connection, jobs: List[dict]) -> None:
+    """
+    Insert many jobs from search cards, with defaults for any field a card lacks, using one
+    executemany in a single transaction.
+    """
+    if not jobs:
+        return
+    q: str = load_sql_queries()["insert_job"]
+    today: str = datetime.now().strftime('%Y-%m-%d')
+    now_ms: int = int(time.time() * 1000)
     try:
-        conn.execute(q, params)
-        conn.commit()
-        logger.debug(f"Inserted minimal job {job.get('job_url', 'No URL')}")
+        with immediate_transaction(conn):
+            conn.executemany(q, [_minimal_job_params(job, today, now_ms) for job in jobs])
+        logger.debug("Inserted %s minimal jobs.", len(jobs))
     except Exception as e:
-        logger.error(f"Insert minimal error: {e}")
+        logger.error("Bulk insert minimal error: %s", e)
+
+def get_incomplete_jobs(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """
+    Return the jobs the details flow still has to visit: never checked, and missing a
+    description, location, company or applicants count. Jobs whose search card supplied
+    all of these are stored complete and never selected; a visit stamps last_checked, so
+    a page that lacks a field is not revisited on every run.
+    """
+    q: str = load_sql_queries()["get_incomplete_jobs"]
+    cursor = conn.execute(q)
+    cols = [desc[0] for desc in cursor.description]
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+def load_job_urls(conn: sqlite3.Connection) -> Set[str]:
+    """
+    Return the job_url of every stored listing, so a scraping run can test for known jobs
+    in memory instead of querying once per candidate.
+    """
+    q: str = load_sql_queries()["load_job_urls"]
+    return {row[0] for row in conn.execute(q)}
 
-def job_exists(conn: sqlite3.Connection, job_url: str) -> bool:
+@contextmanager
+def immediate_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
     """
-    Check if a job listing with the given job_url already exists.
+    Run a block in one BEGIN IMMEDIATE transaction. Taking the write lock up front avoids
+    the deferred-transaction upgrade that fails with SQLITE_BUSY when another writer
+    (e.g. the scraper) got there first.
     """
-    q: str = load_sql_queries()["job_exists"]
-    c = conn.execute(q, (job_url,))
-    row = c.fetchone()
-    return (row[0] > 0) if row else False
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+class ScoreUpdate(NamedTuple):
+    """
+    The columns update_job_scores writes for one job, in the statement's parameter order
+    (last_reranked is stamped at write time). Built straight from an evaluation, so the
+    writer never holds on to full job rows.
+    """
+    preliminary_score: float
+    skills_match: float
+    model_fit_score: float
+    success_probability: float
+    role_complexity: float
+    effort_days_to_fit: float
+    critical_skill_mismatch_penalty: float
+    experience_gap: float
+    areas_for_development: str
+    reasoning: str
+    scoring_model: str
+    job_id: Any
+
+    @classmethod
+    def from_evaluation(
+            cls, job_id: Any, ev: Dict[str, Any], preliminary_score: float, scoring_model: str
+    ) -> "ScoreUpdate":
+        get = ev.get
+        return cls(
+            preliminary_score,
+            get("skills_match", 0.0),
+            get("model_fit_score", 0.0),
+            get("success_probability", 50.0),
+            get("role_complexity", 50.0),
+            get("effort_days_to_fit", 0.0),
+            get("critical_skill_mismatch_penalty", 0.0),
+            get("experience_gap", 0.0),
+            get("areas_for_development", ""),
+            get("reasoning", ""),
+            scoring_model,
+            job_id,
+        )
+
+    def params(self, now: int) -> tuple:
+        return (*self[:10], now, self.scoring_model, self.job_id)
 
 def update_job_scores(conn: sqlite3.Connection, job_id: Any, ranked: Dict[str, Any]) -> None:
     """
     Update the job_listings row with new scoring data, including the scoring_model.
     """
     q: str = load_sql_queries()["update_job_scores"]
-    params = (
-        ranked.get("preliminary_score", 0.0),
-        ranked.get("skills_match", 0.0),
-        ranked.get("model_fit_score", 0.0),
-        ranked.get("success_probability", 50.0),
-        ranked.get("role_complexity", 50.0),
-        ranked.get("effort_days_to_fit", 0.0),
-        ranked.get("critical_skill_mismatch_penalty", 0.0),
-        ranked.get("experience_gap", 0.0),
-        ranked.get("areas_for_development", ""),
-        ranked.get("reasoning", ""),
-        int(time.time()),
-        ranked.get("scoring_model", ""),
-        job_id,
+    update = ScoreUpdate.from_evaluation(
+        job_id, ranked, ranked.get("preliminary_score", 0.0), ranked.get("scoring_model", "")
     )
     try:
-        conn.execute(q, params)
+        conn.execute(q, update.params(int(time.time())))
         conn.commit()
     except Exception as e:
-        logger.error(f"Update scores error: {e}")
+        logger.error("Update scores error: %s", e)
 
-def get_jobs_for_scoring(conn: sqlite3.Connection, limit: int = 1) -> List[Dict[str, Any]]:
+def bulk_update_job_scores(conn: sqlite3.Connection, updates: List[ScoreUpdate]) -> None:
     """
-    Retrieve up to `limit` jobs to be scored from job_listings.
+    Apply many score updates with one executemany in a single transaction. The job_retry
+    table must already exist (see create_candidate_tables).
     """
-    q: str = load_sql_queries()["get_jobs_for_scoring"]
-    c = conn.execute(q, (limit,))
-    rows = c.fetchall()
-    logger.debug(f"Returning {len(rows)} jobs for scoring.")
+    q: Dict[str, str] = load_sql_queries()
+    now: int = int(time.time())
+    try:
+        with immediate_transaction(conn):
+            conn.executemany(q["update_job_scores"], [u.params(now) for u in updates])
+            # A scored job is no longer failing; drop its retry schedule in the same transaction.
+            conn.executemany(q["clear_job_retry"], [(u.job_id,) for u in updates])
+        logger.debug("Wrote scores for %s jobs.", len(updates))
+    except Exception as e:
+        logger.error("Bulk update scores error: %s", e)
+
+def get_scored_job_metrics(conn: sqlite3.Connection, scoring_model: Optional[str] = None) -> sqlite3.Cursor:
+    """
+    Return a cursor over stored evaluation metrics for already-scored jobs, optionally
+    limited to one scoring_model. Rows are
+    (id, skills_match, experience_gap, success_probability, critical_skill_mismatch_penalty,
+    applicants_count, date, company_size_score).
+    """
+    q: str = load_sql_queries()["get_scored_job_metrics"]
+    return conn.execute(q, (scoring_model, scoring_model))
+
+def bulk_update_preliminary_scores(conn: sqlite3.Connection, scores: Iterable[Tuple[int, Any]]) -> None:
+    """
+    Write (preliminary_score, job_id) pairs with one executemany in a single transaction.
+    """
+    q: str = load_sql_queries()["update_preliminary_score"]
+    try:
+        with immediate_transaction(conn):
+            conn.executemany(q, scores)
+    except Exception as e:
+        logger.error("Bulk update preliminary scores error: %s", e)
+
+def bulk_update_job_details(conn: sqlite3.Connection, jobs: List[Dict[str, Any]]) -> None:
+    """
+    Write scraped details for many jobs (matched by job_url) in a single transaction,
+    stamping last_checked so get_incomplete_jobs does not pick them up again. A None date
+    or listed_at keeps the stored value.
+    """
+    q: str = load_sql_queries()["update_job_details"]
+    now_ms: int = int(time.time() * 1000)
+    params = [
+        (
+            job["title"], job["company"], job["company_url"], job["location"], job["description"],
+            job["remote_allowed"], job["job_state"], job["company_size"], job["company_size_score"],
+            job["date"], job["listed_at"], job["applicants_count"], job["overall_relevance"],
+            job["is_posted"], job["application_status"], now_ms, job["job_url"],
+        )
+        for job in jobs
+    ]
+    try:
+        with immediate_transaction(conn):
+            conn.executemany(q, params)
+        logger.debug("Wrote details for %s jobs.", len(jobs))
+    except Exception as e:
+        logger.error("Bulk update details error: %s", e)
+
+def bulk_update_job_status(conn: sqlite3.Connection, updates: List[Dict[str, Any]]) -> None:
+    """
+    Write rechecked status (applicants_count, last_checked, job_state and, when set,
+    application_status) for many jobs, matched by job_url, in a single transaction.
+    """
+    q: str = load_sql_queries()["update_job_status"]
+    params = [
+        (u["applicants_count"], u["last_checked"], u["job_state"], u.get("application_status"), u["job_url"])
+        for u in updates
+    ]
+    try:
+        with immediate_transaction(conn):
+            conn.executemany(q, params)
+        logger.debug("Wrote status for %s jobs.", len(updates))
+    except Exception as e:
+        logger.error("Bulk update status error: %s", e)
+
+class BatchWriter:
+    """
+    Single background writer for one kind of row.
+
+    Producers hand off rows with `put` and continue; the writer drains up to `max_batch_size`
+    rows or `max_wait_ms` worth at a time and commits them together with `_write`, so
+    concurrent producers never contend for SQLite's write lock.
+    """
+    def __init__(self, conn: sqlite3.Connection, max_batch_size: int = 256, max_wait_ms: int = 500) -> None:
+        self.conn = conn
+        self.max_batch_size: int = max(1, max_batch_size)
+        self.max_wait: float = max_wait_ms / 1000.0
+        self._queue: "asyncio.Queue[Optional[Any]]" = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+
+    def put(self, row: Any) -> None:
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run())
+        self._queue.put_nowait(row)
+
+    async def _write(self, batch: List[Any]) -> None:
+        raise NotImplementedError
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch: List[Any] = [item]
+            deadline: float = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            await self._write(batch)
+
+    async def close(self) -> None:
+        """
+        Flush anything still queued and stop the writer.
+        """
+        # A sentinel rather than cancel(): on Python 3.11 wait_for() can swallow a cancellation
+        # that races with a final put, leaving the writer blocked on an empty queue.
+        if self._writer is not None:
+            self._queue.put_nowait(None)
+            await self._writer
+            self._writer = None
+
+class ScoreWriter(BatchWriter):
+    """
+    Background writer for ScoreUpdate rows from concurrent evaluators, committed in a worker
+    thread like JobDetailWriter; give it a connection opened with check_same_thread=False.
+    """
+    async def _write(self, batch: List[ScoreUpdate]) -> None:
+        await asyncio.to_thread(bulk_update_job_scores, self.conn, batch)
+
+class JobDetailWriter(BatchWriter):
+    """
+    Background writer for scraped job details. Each batch is committed in a worker thread,
+    so fsync never blocks the page work on the event loop; give it a connection opened
+    with check_same_thread=False.
+    """
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(bulk_update_job_details, self.conn, batch)
+
+class JobStatusWriter(BatchWriter):
+    """
+    Background writer for rechecked job status rows (see bulk_update_job_status), committed
+    in a worker thread like JobDetailWriter; give it a connection opened with
+    check_same_thread=False.
+    """
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(bulk_update_job_status, self.conn, batch)
+
+def create_candidate_tables(conn: sqlite3.Connection) -> None:
+    """
+    Create the side tables the candidate queries read (poison_jobs, job_retry) if missing.
+    Run once at startup on a write connection (create_table and the processor's main do);
+    the candidate fetches and retry helpers assume they exist.
+    """
+    create_poison_jobs_table(conn)
+    create_job_retry_table(conn)
+
+def _candidate_columns(c: sqlite3.Cursor) -> List[str]:
     cols = [desc[0] for desc in c.description]
     # Remove "total_jobs" if present
     if cols and cols[-1].lower() == "total_jobs":
         cols = cols[:-1]
-    out = [dict(zip(cols, row[:len(cols)])) for row in rows]
-    return out
+    return cols
+
+def _get_candidate_jobs(conn: sqlite3.Connection, candidates: str, limit: int) -> List[Dict[str, Any]]:
+    q: str = load_sql_queries()[candidates]
+    c = conn.execute(q, (limit,))
+    rows = c.fetchall()
+    logger.debug("Returning %s jobs for %s.", len(rows), candidates)
+    cols = _candidate_columns(c)
+    return [dict(zip(cols, row[:len(cols)])) for row in rows]
+
+def get_jobs_for_scoring(conn: sqlite3.Connection, limit: int = 1) -> List[Dict[str, Any]]:
+    """
+    Retrieve up to `limit` jobs to be scored from job_listings, skipping jobs held for retry.
+    """
+    return _get_candidate_jobs(conn, "get_jobs_for_scoring", limit)
 
 def get_jobs_for_rescoring(conn: sqlite3.Connection, limit: int = 1) -> List[Dict[str, Any]]:
     """
-    Retrieve up to `limit` jobs that qualify for rescoring from job_listings.
+    Retrieve up to `limit` jobs that qualify for rescoring from job_listings, skipping jobs held for retry.
     """
-    q: str = load_sql_queries()["get_jobs_for_rescoring"]
-    c = conn.execute(q, (limit,))
-    rows = c.fetchall()
-    logger.debug(f"Returning {len(rows)} jobs for rescoring.")
-    cols = [desc[0] for desc in c.description]
-    if cols and cols[-1].lower() == "total_jobs":
-        cols = cols[:-1]
-    out = [dict(zip(cols, row[:len(cols)])) for row in rows]
-    return out
+    return _get_candidate_jobs(conn, "get_jobs_for_rescoring", limit)
+
+def _iter_candidate_jobs(
+        conn: sqlite3.Connection,
+        candidates: str,
+        limit: int,
+        batch_size: int
+) -> Iterator[Dict[str, Any]]:
+    # The candidate query runs as the top-level statement, so its ORDER BY holds.
+    c = conn.execute(load_sql_queries()[candidates], (limit,))
+    c.arraysize = batch_size
+    cols = _candidate_columns(c)
+    while True:
+        rows = c.fetchmany()
+        if not rows:
+            break
+        for row in rows:
+            yield dict(zip(cols, row[:len(cols)]))
 
-def get_job_ids_for_scoring(conn: sqlite3.Connection) -> List[int]:
+def iter_jobs_for_scoring(
+        conn: sqlite3.Connection,
+        limit: int = 1000,
+        batch_size: int = 256
+) -> Iterator[Dict[str, Any]]:
     """
-    Return a batch of up to 1000 job IDs for scoring.
+    Stream the job_listings rows due for scoring, skipping jobs held for retry.
     """
-    jobs = get_jobs_for_scoring(conn, limit=1000)
-    return [job["id"] for job in jobs]
+    return _iter_candidate_jobs(conn, "get_jobs_for_scoring", limit, batch_size)
 
-def get_job_ids_for_rescoring(conn: sqlite3.Connection) -> List[int]:
+def iter_jobs_for_rescoring(
+        conn: sqlite3.Connection,
+        limit: int = 1000,
+        batch_size: int = 256
+) -> Iterator[Dict[str, Any]]:
     """
-    Return a batch of up to 1000 job IDs for rescoring.
+    Stream the job_listings rows due for rescoring, in the query's order, skipping jobs held for retry.
     """
-    jobs = get_jobs_for_rescoring(conn, limit=1000)
-    return [job["id"] for job in jobs]
+    return _iter_candidate_jobs(conn, "get_jobs_for_rescoring", limit, batch_size)
 
-def get_job_by_id(conn: sqlite3.Connection, job_id: int) -> Dict[str, Any]:
+async def prefetch_rows(rows: Iterator[Dict[str, Any]], batch_size: int = 256) -> AsyncIterator[Dict[str, Any]]:
     """
-    Retrieve a single job row by ID from job_listings.
+    Pull `rows` in chunks of `batch_size` on a worker thread, fetching the next chunk while the
+    caller works through the current one, so query execution never blocks the event loop.
     """
-    query = "SELECT * FROM job_listings WHERE id = ?"
-    c = conn.execute(query, (job_id,))
-    row = c.fetchone()
-    if not row:
-        return {}
-    cols = [desc[0] for desc in c.description]
-    return dict(zip(cols, row))
+    def take() -> List[Dict[str, Any]]:
+        return list(itertools.islice(rows, batch_size))
+
+    pending: asyncio.Future = asyncio.ensure_future(asyncio.to_thread(take))
+    try:
+        while True:
+            chunk = await pending
+            if not chunk:
+                break
+            pending = asyncio.ensure_future(asyncio.to_thread(take))
+            for row in chunk:
+                yield row
+    finally:
+        # Never leave the iterator running on another thread after the caller is gone.
+        if not pending.done():
+            await asyncio.gather(pending, return_exceptions=True)
 
 def get_jobs_to_update(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     q: str = load_sql_queries()["get_jobs_to_update"]
@@ -0,0 +1 @@
+DELETE FROM job_retry WHERE job_id = ?
\ No newline at end of file
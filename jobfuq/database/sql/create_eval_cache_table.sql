@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS eval_cache (
+                                          prompt_hash BLOB PRIMARY KEY,
+                                          scoring_model TEXT NOT NULL,
+                                          evaluation_json TEXT NOT NULL,
+                                          created_at INTEGER NOT NULL,
+                                          last_used INTEGER NOT NULL
+)
\ No newline at end of file
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS job_retry (
+                                          job_id INTEGER PRIMARY KEY,
+                                          due_ts REAL NOT NULL,
+                                          attempts INTEGER NOT NULL DEFAULT 1,
+                                          failures INTEGER NOT NULL DEFAULT 0
+)
\ No newline at end of file
@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS poison_jobs (
+                                          job_id INTEGER PRIMARY KEY,
+                                          reason TEXT,
+                                          created_at INTEGER NOT NULL
+)
\ No newline at end of file
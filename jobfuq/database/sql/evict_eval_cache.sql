@@ -0,0 +1,7 @@
+DELETE FROM eval_cache
+WHERE created_at < ?
+   OR prompt_hash NOT IN (
+    SELECT prompt_hash FROM eval_cache
+    ORDER BY created_at DESC
+    LIMIT ?
+)
\ No newline at end of file
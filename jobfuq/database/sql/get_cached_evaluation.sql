@@ -0,0 +1,4 @@
+SELECT evaluation_json
+FROM eval_cache
+WHERE prompt_hash = ?
+  AND created_at >= ?
\ No newline at end of file
@@ -0,0 +1,9 @@
+SELECT * FROM main.job_listings
+WHERE last_checked IS NULL
+  AND (
+    trim(coalesce(description, '')) = ''
+    OR trim(coalesce(location, '')) = ''
+    OR applicants_count IS NULL
+    OR company IS NULL
+    OR company = 'No Company'
+  );
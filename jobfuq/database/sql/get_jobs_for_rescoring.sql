@@ -3,6 +3,7 @@ WITH RescoreJobs AS (
         jl.id,
         jl.company,
         jl.title,
+        jl.location,
         jl.description,
         jl.application_status,
         jl.date,
@@ -49,6 +50,9 @@ WITH RescoreJobs AS (
       AND jl.company IS NOT NULL
       AND jl.description IS NOT NULL
       AND TRIM(jl.description) <> ''
+      -- Skip jobs held for retry and jobs that can never be evaluated
+      AND jl.id NOT IN (SELECT job_id FROM job_retry WHERE due_ts > strftime('%s','now'))
+      AND jl.id NOT IN (SELECT job_id FROM poison_jobs)
 
       -- Exclude blacklisted companies
       AND NOT EXISTS (
@@ -2,6 +2,7 @@ WITH RankedJobs AS (
     SELECT jl.id,
            jl.company,
            jl.title,
+           jl.location,
            jl.description,
            jl.application_status,
            jl.date,
@@ -41,6 +42,9 @@ WITH RankedJobs AS (
       AND jl.description IS NOT NULL
       AND TRIM(jl.description) <> ''
       AND jl.title IS NOT NULL
+      -- Skip jobs held for retry and jobs that can never be evaluated
+      AND jl.id NOT IN (SELECT job_id FROM job_retry WHERE due_ts > strftime('%s','now'))
+      AND jl.id NOT IN (SELECT job_id FROM poison_jobs)
 )
 SELECT *,
        (SELECT COUNT(*)
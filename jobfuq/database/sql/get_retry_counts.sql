@@ -0,0 +1 @@
+SELECT attempts, failures FROM job_retry WHERE job_id = ?
\ No newline at end of file
@@ -0,0 +1,13 @@
+SELECT id,
+       COALESCE(skills_match, 0.0),
+       COALESCE(experience_gap, 0.0),
+       COALESCE(success_probability, 50.0),
+       COALESCE(critical_skill_mismatch_penalty, 0.0),
+       COALESCE(applicants_count, 0),
+       date,
+       COALESCE(company_size_score, 0)
+FROM job_listings
+WHERE is_posted = 1
+  AND scoring_model IS NOT NULL
+  AND scoring_model <> ''
+  AND (? IS NULL OR scoring_model = ?)
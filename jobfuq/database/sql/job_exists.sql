@@ -1 +0,0 @@
-SELECT 1 FROM job_listings WHERE job_url = ? LIMIT 1;
\ No newline at end of file
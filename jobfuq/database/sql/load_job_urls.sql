@@ -0,0 +1 @@
+SELECT job_url FROM job_listings;
\ No newline at end of file
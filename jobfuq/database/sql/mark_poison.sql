@@ -0,0 +1,2 @@
+INSERT OR REPLACE INTO poison_jobs (job_id, reason, created_at)
+VALUES (?, ?, ?)
\ No newline at end of file
@@ -0,0 +1,7 @@
+INSERT OR REPLACE INTO eval_cache (
+    prompt_hash,
+    scoring_model,
+    evaluation_json,
+    created_at,
+    last_used
+) VALUES (?, ?, ?, ?, ?)
\ No newline at end of file
@@ -0,0 +1,4 @@
+INSERT INTO job_retry (job_id, due_ts, attempts, failures)
+VALUES (?, ?, 1, ?)
+ON CONFLICT(job_id) DO UPDATE SET due_ts = excluded.due_ts, attempts = job_retry.attempts + 1,
+                                  failures = job_retry.failures + excluded.failures
\ No newline at end of file
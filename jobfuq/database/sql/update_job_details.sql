@@ -0,0 +1,19 @@
+UPDATE job_listings
+SET
+    title = ?,
+    company = ?,
+    company_url = ?,
+    location = ?,
+    description = ?,
+    remote_allowed = ?,
+    job_state = ?,
+    company_size = ?,
+    company_size_score = ?,
+    date = COALESCE(?, date),
+    listed_at = COALESCE(?, listed_at),
+    applicants_count = ?,
+    overall_relevance = ?,
+    is_posted = ?,
+    application_status = ?,
+    last_checked = ?
+WHERE job_url = ?;
@@ -0,0 +1,7 @@
+UPDATE job_listings
+SET
+    applicants_count = ?,
+    last_checked = ?,
+    job_state = ?,
+    application_status = COALESCE(?, application_status)
+WHERE job_url = ?;
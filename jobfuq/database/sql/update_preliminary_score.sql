@@ -0,0 +1,3 @@
+UPDATE job_listings
+SET preliminary_score = ?
+WHERE id = ?;
\ No newline at end of file
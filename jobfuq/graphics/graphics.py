@@ -6,67 +6,138 @@ This module handles all visual rendering tasks. It formats and displays data
 structured, visually appealing way using Rich.
 """
 import asyncio
-import json
+import sys
+from typing import List, Optional, Tuple
+from rich.cells import cell_len
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
 from rich.text import Text
 
+from jobfuq.logger.logger import logger
+from jobfuq.utils.utils import json_dumps
+
 console = Console()
 
+# Per-value (0..100) lookup tables for metric rendering.
+_BLOCKS = ("░",) * 25 + ("▒",) * 25 + ("▓",) * 25 + ("█",) * 26
+_COLOR_LUT = ("red",) * 25 + ("dark_orange",) * 25 + ("yellow",) * 25 + ("green",) * 26
+_REV_COLOR_LUT = _COLOR_LUT[::-1]
+# Complete interned markup cell per value, e.g. "[green]█  81[/]".
+_CELLS_FWD = tuple(sys.intern(f"[{_COLOR_LUT[v]}]{_BLOCKS[v]} {v:3d}[/]") for v in range(101))
+_CELLS_REV = tuple(sys.intern(f"[{_REV_COLOR_LUT[v]}]{_BLOCKS[v]} {v:3d}[/]") for v in range(101))
+
+# (label, reverse) per metric row, in display order.
+_METRICS = (
+    ("🏆 Preliminary Score", False),
+    ("✅ Skills Match", False),
+    ("📊 Model Fit", False),
+    ("🎯 Success Prob.", False),
+    ("⚠️ Experience Gap", True),
+    ("🚫 Crit. Penalty", True),
+    ("🤔 Role Complexity", True),
+    ("⏳ Effort Days", True),
+    ("🕒 Recency", False),
+    ("👥 Applicants", True),
+)
+_LABEL_WIDTH = max(cell_len(label) for label, _ in _METRICS) + 2
+# Row prefixes are padded by terminal cell width so emoji labels line up.
+_ROWS = tuple(
+    (f"[cyan]{label}[/cyan]" + " " * (_LABEL_WIDTH - cell_len(label)), reverse)
+    for label, reverse in _METRICS
+)
+
+def ascii_block(value: int) -> str:
+    return _BLOCKS[max(0, min(value, 100))]
+
+def color_for_value(value: int, reverse: bool = False) -> str:
+    return (_REV_COLOR_LUT if reverse else _COLOR_LUT)[max(0, min(value, 100))]
+
+def format_metric_as_block(value: int, reverse: bool = False) -> str:
+    if 0 <= value <= 100:
+        return (_CELLS_REV if reverse else _CELLS_FWD)[value]
+    # Out-of-range counts (e.g. applicants) keep their real number with the clamped style.
+    return f"[{color_for_value(value, reverse)}]{ascii_block(value)} {value:3d}[/]"
+
 def render_evaluation(updated: dict, recency: float, app_count: int) -> None:
     """
-    Render job evaluation details.py as a Rich table and panel.
+    Render job evaluation metrics and details as two side-by-side panels.
     """
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Metric", style="cyan", justify="left")
-    table.add_column("Value", style="green", justify="right")
-
-    # Extract metrics
-    prelim = int(round(updated.get("preliminary_score", 0.0)))
-    skills = int(round(updated.get("skills_match", 0)))
-    model_fit = int(round(updated.get("model_fit_score", 0)))
-    success_prob = int(round(updated.get("success_probability", 50)))
-    exp_gap = int(round(updated.get("experience_gap", 0)))
-    crit_penalty = int(round(updated.get("critical_skill_mismatch_penalty", 0)))
-    role_complex = int(round(updated.get("role_complexity", 0)))
-    effort_days = int(round(updated.get("effort_days_to_fit", 0)))
-    recency_val = int(round(recency))
-    applicants = int(round(app_count))
-
-    # Helper function to create an ASCII block for a given value.
-    def ascii_block(value: int) -> str:
-        if value >= 75:
-            return "█"
-        elif value >= 50:
-            return "▓"
-        elif value >= 25:
-            return "▒"
-        return "░"
-
-    def add_metric(label: str, value: int, reverse: bool = False) -> None:
-        block = ascii_block(value)
-        table.add_row(label, f"{block} {value}")
-
-    add_metric("🏆 Preliminary Score", prelim)
-    add_metric("✅ Skills Match", skills)
-    add_metric("📊 Model Fit", model_fit)
-    add_metric("🎯 Success Prob.", success_prob)
-    add_metric("⚠️ Experience Gap", exp_gap, reverse=True)
-    add_metric("🚫 Crit. Penalty", crit_penalty, reverse=True)
-    add_metric("🤔 Role Complexity", role_complex, reverse=True)
-    add_metric("⏳ Effort Days", effort_days, reverse=True)
-    add_metric("🕒 Recency", recency_val)
-    add_metric("👥 Applicants", applicants, reverse=True)
+    values = (
+        int(round(updated.get("preliminary_score", 0.0))),
+        int(round(updated.get("skills_match", 0))),
+        int(round(updated.get("model_fit_score", 0))),
+        int(round(updated.get("success_probability", 50))),
+        int(round(updated.get("experience_gap", 0))),
+        int(round(updated.get("critical_skill_mismatch_penalty", 0))),
+        int(round(updated.get("role_complexity", 0))),
+        int(round(updated.get("effort_days_to_fit", 0))),
+        int(round(recency)),
+        int(round(app_count)),
+    )
+    metrics = "\n".join(
+        prefix + format_metric_as_block(value, reverse)
+        for (prefix, reverse), value in zip(_ROWS, values)
+    )
 
     details = (
         f"💼 [bold blue]{updated.get('title', 'N/A')}[/bold blue] @ [bold green]{updated.get('company', 'N/A')}[/bold green]\n\n"
         f"📝 [bold yellow]Reasoning:[/bold yellow]\n{updated.get('reasoning', 'No reasoning provided.')}\n\n"
         f"🛠️ [bold yellow]Development Areas:[/bold yellow]\n{updated.get('areas_for_development', 'None specified.')}"
     )
-    panel = Panel(details, title="[bold blue]Job Details[/bold blue]", border_style="bright_blue")
-    console.print(Columns([table, panel], equal=True, expand=True))
+    console.print(
+        Columns([
+            Panel(metrics, title="[bold magenta]Metrics[/bold magenta]", border_style="magenta"),
+            Panel(details, title="[bold blue]Job Details[/bold blue]", border_style="bright_blue"),
+        ], equal=True, expand=True),
+        highlight=False,
+    )
+
+class EvaluationPrinter:
+    """
+    Render verbose evaluation panels off the event loop.
+
+    Evaluators hand off results with `put` and continue; a single background task drains
+    whatever has queued up and renders it in a worker thread, so Rich layout and terminal
+    writes never stall in-flight requests and panels still appear in completion order.
+    """
+    def __init__(self) -> None:
+        self._queue: "asyncio.Queue[Optional[Tuple[dict, float, int]]]" = asyncio.Queue()
+        self._printer: Optional[asyncio.Task] = None
+
+    def put(self, updated: dict, recency: float, app_count: int) -> None:
+        if self._printer is None:
+            self._printer = asyncio.create_task(self._run())
+        self._queue.put_nowait((updated, recency, app_count))
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch[-1] is None:
+                closing = True
+                batch.pop()
+            if batch:
+                await asyncio.to_thread(_render_evaluations, batch)
+
+    async def close(self) -> None:
+        """
+        Render anything still queued and stop the printer.
+        """
+        if self._printer is not None:
+            self._queue.put_nowait(None)
+            await self._printer
+            self._printer = None
+
+def _render_evaluations(batch: List[Tuple[dict, float, int]]) -> None:
+    for updated, recency, app_count in batch:
+        try:
+            render_evaluation(updated, recency, app_count)
+        except Exception as e:
+            logger.error("Error rendering evaluation for job %s: %s", updated.get("id", "Unknown"), e)
 
 def render_live_status(status: dict) -> None:
     """
@@ -83,7 +154,7 @@ def render_json(data: dict) -> None:
     """
     Render JSON data with syntax highlighting.
     """
-    json_text = json.dumps(data, indent=2)
+    json_text = json_dumps(data, indent=True).decode("utf-8")
     console.print(f"[bold blue]JSON Output:[/bold blue]\n[cyan]{json_text}[/cyan]")
 
 def render_config_flags(config: dict, args: any) -> None:
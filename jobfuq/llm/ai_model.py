@@ -1,14 +1,138 @@
 from __future__ import annotations
-import json
+import asyncio
+import functools
+import hashlib
 import os
 import re
-from typing import Dict, Any, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 
 import tiktoken
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from jobfuq.llm.errors import TransientError, classify_error, should_retry
 from jobfuq.llm.models.openrouter import OpenRouterModel
 from jobfuq.llm.models.together import TogetherModel
 from jobfuq.logger.logger import logger
+from jobfuq.utils.utils import json_loads
+
+_BATCH_INSTRUCTIONS = (
+    "\n\nThe input above contains {count} separate job postings (### Job 1 to ### Job {count}). "
+    "Evaluate each posting independently and respond with a JSON array of exactly {count} objects, "
+    "in the same order, each following the JSON format described above."
+)
+
+_JOB_TEMPLATE = "Company: {}\nTitle: {}\nLocation: {}\nDescription: {}".format
+
+# Scores reported when an evaluation fails; "reasoning" is filled with the error message.
+_ERROR_TEMPLATE: Dict[str, Any] = {
+    "skills_match": 0.0,
+    "experience_gap": 15.0,
+    "model_fit_score": 0.0,
+    "reasoning": "",
+    "areas_for_development": "Error during evaluation",
+    "success_probability": 50.0,
+    "role_complexity": 50.0,
+    "effort_days_to_fit": 10.0,
+    "critical_skill_mismatch_penalty": 0.0,
+    "query_token_count": 0,
+    "response_token_count": 0,
+}
+
+def _parse_pct(value: Any, default: float) -> int:
+    """Parse a percentage value, scale fractions to 0-100 and clamp in a single pass."""
+    if value is None:
+        val: float = default
+    else:
+        s: str = str(value).strip()
+        if s.endswith("%"):
+            s = s[:-1]
+        try:
+            val = float(s)
+        except ValueError:
+            return 0
+    if 0 < val < 2:
+        val *= 100
+    try:
+        ival: int = int(round(val))
+    except (ValueError, OverflowError):
+        return 0
+    if ival < 0:
+        return 0
+    if ival > 100:
+        return 100
+    return ival
+
+
+def _parse_days(value: Any) -> int:
+    s: str = str(value).strip()
+    if s.endswith("%"):
+        s = s[:-1]
+    try:
+        return int(round(float(s)))
+    except (ValueError, OverflowError):
+        return 0
+
+
+# tiktoken releases the GIL, so tokenizing on a small pool keeps the event loop free. One
+# pool is shared by every AIModel, so building a model per key and recipe adds no threads.
+_TOK_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tokenizer")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompt_template(path: str) -> str:
+    with open(path, "r") as file:
+        return file.read()
+
+
+@functools.lru_cache(maxsize=512)
+def _truncate_tokens(encoding_name: str, text: str, max_tokens: int) -> str:
+    # Every BPE token covers at least one UTF-8 byte, so short texts can skip encoding.
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    encoder = tiktoken.get_encoding(encoding_name)
+    tokens: List[int] = encoder.encode_ordinary(text)
+    if len(tokens) > max_tokens:
+        return encoder.decode(tokens[:max_tokens])
+    return text
+
+
+# Fields extracted from a model response: (key, default, kind).
+_SCHEMA = (
+    ("skills_match", 0.0, "pct"),
+    ("experience_gap", 15.0, "pct"),
+    ("model_fit_score", 0.0, "pct"),
+    ("success_probability", 50.0, "pct"),
+    ("role_complexity", 50.0, "pct"),
+    ("effort_days_to_fit", 7.0, "days"),
+    ("critical_skill_mismatch_penalty", 0.0, "pct"),
+    ("areas_for_development", "", "str"),
+    ("reasoning", "", "str"),
+)
+
+
+def _build_parser(schema: tuple) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate a straight-line parser for the given schema, so each response is parsed
+    without looping over the fields or dispatching on their kind.
+    """
+    lines: List[str] = []
+    for key, default, kind in schema:
+        if kind == "pct":
+            expr = f"_pct(get({key!r}), {default!r})"
+        elif kind == "days":
+            expr = f"_days(get({key!r}, {default!r}))"
+        else:
+            expr = f"str(get({key!r}, {default!r})).strip()"
+        lines.append(f"        {key!r}: {expr},")
+    src: str = "def _parse(data):\n    get = data.get\n    return {\n" + "\n".join(lines) + "\n    }\n"
+    namespace: Dict[str, Any] = {"_pct": _parse_pct, "_days": _parse_days}
+    exec(src, namespace)
+    return namespace["_parse"]
+
+
+_parse_scores = _build_parser(_SCHEMA)
+
 
 # Note: We now use a forward reference for ProviderManager.
 class AIModel:
@@ -16,10 +140,18 @@ class AIModel:
         self.config: Dict[str, Any] = config
         self.provider_manager: ProviderManager = provider_manager
         self.encoder = tiktoken.encoding_for_model("gpt-3.5-turbo")
-        prompt_path: str = self.config.get("prompt", "../prompts/private_deepsek_r1_career_advisor_devops.txt")
+        self._tok_executor: ThreadPoolExecutor = _TOK_EXECUTOR
+        prompt_path: str = self.config.get("ai_providers", {}).get(
+            "prompt", self.config.get("prompt", "../prompts/private_deepsek_r1_career_advisor_devops.txt")
+        )
         prompt_path = os.path.join(os.path.dirname(__file__), prompt_path)
-        with open(prompt_path, "r") as file:
-            self.prompt_template: str = file.read()
+        self.prompt_template: str = _load_prompt_template(prompt_path)
+        self._prompt_prefix, sep, self._prompt_suffix = self.prompt_template.partition("{job_description}")
+        self._has_placeholder: bool = bool(sep)
+        # Identifies the instructions the job text is evaluated under, for cache keys.
+        self.prompt_digest: bytes = hashlib.blake2b(
+            (self.get_system_message() + "\0" + self.prompt_template).encode("utf-8"), digest_size=8
+        ).digest()
         self.together_model: TogetherModel = TogetherModel(config, self.get_system_message())
         self.openrouter_model: OpenRouterModel = OpenRouterModel(config, self.get_system_message())
 
@@ -27,79 +159,139 @@ class AIModel:
         return "".join(char for char in text if char.isprintable())
 
     def truncate_text(self, text: str, max_tokens: int) -> str:
-        tokens: List[int] = self.encoder.encode(text)
-        if len(tokens) > max_tokens:
-            return self.encoder.decode(tokens[:max_tokens])
-        return text
+        # Cached per encoding rather than per instance, so models never pin each other.
+        return _truncate_tokens(self.encoder.name, text, max_tokens)
 
     def create_prompt(self, job_description: str) -> str:
+        if not self._has_placeholder:
+            return self.prompt_template
         safe_text: str = self.truncate_text(self.sanitize_input(job_description), 3000)
-        return self.prompt_template.replace("{job_description}", safe_text)
+        return self._prompt_prefix + safe_text + self._prompt_suffix
 
     def get_system_message(self) -> str:
         return "You are an AI career advisor. Provide concise JSON answers."
 
-    @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=10, min=10, max=60))
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=10, min=10, max=60),
+        retry=retry_if_exception(should_retry),
+        reraise=True,
+    )
     async def evaluate_job_fit(self, job_info: Dict[str, Any]) -> Dict[str, Any]:
-        provider: str = self.provider_manager.get_provider()
-        job_description: str = (
-            f"Company: {job_info.get('company', 'Unknown')}\n"
-            f"Title: {job_info.get('title', 'Unknown')}\n"
-            f"Location: {job_info.get('location', 'Unknown')}\n"
-            f"Description: {job_info.get('description', 'No description available')}"
+        job_description: str = _JOB_TEMPLATE(
+            job_info.get("company", "Unknown"),
+            job_info.get("title", "Unknown"),
+            job_info.get("location", "Unknown"),
+            job_info.get("description", "No description available"),
         )
-        prompt: str = self.create_prompt(job_description)
+        loop = asyncio.get_running_loop()
+        prompt: str = await loop.run_in_executor(self._tok_executor, self.create_prompt, job_description)
+        provider: str = self.provider_manager.get_provider()
         if not provider:
             logger.error("No available providers.")
             return self.create_error_response("No available providers.")
+        if provider not in ("together", "openrouter"):
+            logger.error("Provider '%s' not available.", provider)
+            return self.create_error_response(f"Provider '{provider}' not available.")
+        raw_result: str = await self._call_provider(provider, prompt)
+        qt, rt = await self._count_tokens(prompt, raw_result)
+        extracted: Dict[str, Any] = self.extract_scores(raw_result)
+        extracted["query_token_count"] = qt
+        extracted["response_token_count"] = rt
+        return extracted
+
+    async def _call_provider(self, provider: str, prompt: str) -> str:
         try:
+            started: float = time.monotonic()
             if provider == "together":
                 raw_result: str = await self.together_model.evaluate(prompt)
-            elif provider == "openrouter":
-                raw_result = await self.openrouter_model.evaluate(prompt)
             else:
-                logger.error(f"Provider '{provider}' not available.")
-                return self.create_error_response(f"Provider '{provider}' not available.")
-            self.provider_manager.report_success(provider)
-            qt: int = len(self.encoder.encode(prompt))
-            rt: int = len(self.encoder.encode(raw_result))
-            logger.info(f"Raw response ({provider}): {raw_result}")
-            extracted: Dict[str, Any] = self.extract_scores(raw_result)
-            extracted["query_token_count"] = qt
-            extracted["response_token_count"] = rt
-            return extracted
+                raw_result = await self.openrouter_model.evaluate(prompt)
+            self.provider_manager.report_success(provider, time.monotonic() - started)
         except Exception as e:
             self.provider_manager.report_failure(provider)
-            raise e
+            raise classify_error(e) from e
+        logger.info("Raw response (%s): %s", provider, raw_result)
+        return raw_result
+
+    async def _count_tokens(self, prompt: str, raw_result: str) -> Tuple[int, int]:
+        loop = asyncio.get_running_loop()
+        qt: int = len(await loop.run_in_executor(self._tok_executor, self.encoder.encode, prompt))
+        rt: int = len(await loop.run_in_executor(self._tok_executor, self.encoder.encode, raw_result))
+        return qt, rt
+
+    def create_batch_prompt(self, job_descriptions: List[str]) -> str:
+        sections: List[str] = [
+            f"### Job {i}\n{self.truncate_text(self.sanitize_input(text), 3000)}"
+            for i, text in enumerate(job_descriptions, 1)
+        ]
+        body: str = "\n\n".join(sections)
+        if self._has_placeholder:
+            prompt: str = self._prompt_prefix + body + self._prompt_suffix
+        else:
+            prompt = self.prompt_template + "\n\n" + body
+        return prompt + _BATCH_INSTRUCTIONS.format(count=len(job_descriptions))
+
+    async def evaluate_jobs_fit(self, jobs: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Evaluate several jobs with a single provider request.
+
+        The jobs are packed into one prompt that asks for a JSON array with one object per job.
+        If the provider rejects the batch or the response cannot be matched to the jobs, each
+        job is evaluated separately instead; a job whose own evaluation fails gets its
+        exception in place of a result, so one bad job does not fail the rest of the batch.
+        A TransientError (rate limit, overload, timeout) is raised instead: splitting the
+        batch would multiply requests exactly when the provider asks for fewer, so it is left
+        to KeyPool and the dispatch gate to back off.
+        """
+        if len(jobs) == 1:
+            try:
+                return [await self.evaluate_job_fit(jobs[0])]
+            except TransientError:
+                raise
+            except Exception as e:
+                return [e]
+        descriptions: List[str] = [
+            _JOB_TEMPLATE(
+                job.get("company", "Unknown"),
+                job.get("title", "Unknown"),
+                job.get("location", "Unknown"),
+                job.get("description", "No description available"),
+            )
+            for job in jobs
+        ]
+        loop = asyncio.get_running_loop()
+        prompt: str = await loop.run_in_executor(self._tok_executor, self.create_batch_prompt, descriptions)
+        provider: str = self.provider_manager.get_provider()
+        results: Optional[List[Dict[str, Any]]] = None
+        if provider in ("together", "openrouter"):
+            try:
+                raw_result: str = await self._call_provider(provider, prompt)
+                results = self.extract_batch_scores(raw_result, len(jobs))
+                if results is not None:
+                    qt, rt = await self._count_tokens(prompt, raw_result)
+                    for r in results:
+                        r["query_token_count"] = qt // len(jobs)
+                        r["response_token_count"] = rt // len(jobs)
+            except TransientError:
+                raise
+            except Exception as e:
+                logger.warning("Batch evaluation of %s jobs failed: %s", len(jobs), e)
+        if results is None:
+            logger.warning("Falling back to individual evaluation for %s jobs.", len(jobs))
+            results = list(await asyncio.gather(*(self.evaluate_job_fit(job) for job in jobs), return_exceptions=True))
+        return results
 
     def create_error_response(self, error_message: str) -> Dict[str, Any]:
-        return {
-            "skills_match": 0.0,
-            "experience_gap": 15.0,
-            "model_fit_score": 0.0,
-            "reasoning": error_message,
-            "areas_for_development": "Error during evaluation",
-            "success_probability": 50.0,
-            "role_complexity": 50.0,
-            "effort_days_to_fit": 10.0,
-            "critical_skill_mismatch_penalty": 0.0,
-            "query_token_count": 0,
-            "response_token_count": 0,
-        }
+        resp: Dict[str, Any] = _ERROR_TEMPLATE.copy()
+        resp["reasoning"] = error_message
+        return resp
 
     def remove_think_tags(self, text: str) -> str:
         return re.sub(r"<think>[\s\S]*?</think>", "", text, flags=re.IGNORECASE)
 
     def extract_scores(self, text: str) -> Dict[str, Any]:
         cleaned_text: str = self.remove_think_tags(text)
-        def safe_float(value: Any) -> float:
-            try:
-                s: str = str(value).strip()
-                if s.endswith("%"):
-                    s = s[:-1]
-                return float(s)
-            except Exception:
-                return 0.0
         json_patterns: List[str] = [
             r"```json\s*(\{[\s\S]*?\})\s*```",
             r"```\s*(\{[\s\S]*?\})\s*```",
@@ -110,45 +302,39 @@ class AIModel:
             match = re.search(pattern, cleaned_text)
             if match:
                 try:
-                    data = json.loads(match.group(1))
+                    data = json_loads(match.group(1))
                     break
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
         if not data:
             logger.warning("No JSON found in response after removing <think> tags.")
-        def scale_if_needed(x: Any, default: float) -> float:
-            val: float = safe_float(x) if x is not None else default
-            if 0 < val < 2:
-                return val * 100
-            return val
-        result: Dict[str, Any] = {
-            "skills_match": scale_if_needed(data.get("skills_match"), 0.0),
-            "experience_gap": scale_if_needed(data.get("experience_gap"), 15.0),
-            "model_fit_score": scale_if_needed(data.get("model_fit_score"), 0.0),
-            "success_probability": scale_if_needed(data.get("success_probability"), 50.0),
-            "role_complexity": scale_if_needed(data.get("role_complexity"), 50.0),
-            "effort_days_to_fit": safe_float(data.get("effort_days_to_fit", 7.0)),
-            "critical_skill_mismatch_penalty": scale_if_needed(data.get("critical_skill_mismatch_penalty"), 0.0),
-            "areas_for_development": str(data.get("areas_for_development", "")).strip(),
-            "reasoning": str(data.get("reasoning", "")).strip(),
-        }
-        def clamp100(x: float) -> int:
-            val: int = int(round(x))
-            if val < 0:
-                return 0
-            if val > 100:
-                return 100
-            return val
-        for key in [
-            "skills_match",
-            "experience_gap",
-            "model_fit_score",
-            "success_probability",
-            "role_complexity",
-            "critical_skill_mismatch_penalty",
-        ]:
-            result[key] = clamp100(result[key])
-        result["effort_days_to_fit"] = int(round(result["effort_days_to_fit"]))
+        return self.scores_from_data(data)
+
+    def extract_batch_scores(self, text: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse a JSON array of `count` evaluations. Returns None if the response does not
+        contain exactly one object per job.
+        """
+        cleaned_text: str = self.remove_think_tags(text)
+        json_patterns: List[str] = [
+            r"```json\s*(\[[\s\S]*\])\s*```",
+            r"```\s*(\[[\s\S]*\])\s*```",
+            r"(\[[\s\S]*\])",
+        ]
+        for pattern in json_patterns:
+            match = re.search(pattern, cleaned_text)
+            if match:
+                try:
+                    items = json_loads(match.group(1))
+                except ValueError:
+                    continue
+                if isinstance(items, list) and len(items) == count and all(isinstance(i, dict) for i in items):
+                    return [self.scores_from_data(item) for item in items]
+        logger.warning("Batch response did not contain a JSON array of %s evaluations.", count)
+        return None
+
+    def scores_from_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        result: Dict[str, Any] = _parse_scores(data)
         numeric_keys: List[str] = [
             "skills_match",
             "experience_gap",
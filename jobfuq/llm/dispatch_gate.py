@@ -0,0 +1,61 @@
+"""
+Dispatch Gate Module
+
+Adaptive replacement for a fixed concurrency semaphore. The number of evaluations allowed
+in flight follows AIMD: it grows by about one slot per round of successful requests, halves
+when a provider signals overload (429 or 5xx), and shrinks by about one slot per round
+while observed latency sits well above the best latency seen so far.
+"""
+
+import asyncio
+from typing import Optional
+
+
+class DispatchGate:
+    def __init__(
+            self,
+            max_inflight: int,
+            min_inflight: int = 1,
+            latency_alpha: float = 0.3,
+            latency_tolerance: float = 3.0
+    ) -> None:
+        self.max_inflight: int = max(1, max_inflight)
+        self.min_inflight: int = max(1, min(min_inflight, self.max_inflight))
+        self.limit: float = float(self.max_inflight)
+        self.inflight: int = 0
+        self.latency_alpha: float = latency_alpha
+        self.latency_tolerance: float = latency_tolerance
+        self.latency: Optional[float] = None  # EWMA of request latency in seconds.
+        self.best_latency: Optional[float] = None
+        self._cond: asyncio.Condition = asyncio.Condition()
+
+    async def wait(self) -> None:
+        """Block until the current limit allows another request in flight, then take a slot."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.inflight < int(self.limit))
+            self.inflight += 1
+
+    async def done(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Release a slot and adapt the limit to the outcome of the request. Pass no latency for
+        work that never reached a provider (e.g. a cache hit) so it does not skew the estimate.
+        """
+        async with self._cond:
+            self.inflight -= 1
+            if overloaded:
+                self.limit = max(float(self.min_inflight), self.limit / 2)
+            elif latency is not None:
+                self._observe(latency)
+                if self.latency > self.best_latency * self.latency_tolerance:
+                    self.limit = max(float(self.min_inflight), self.limit - 1 / self.limit)
+                else:
+                    self.limit = min(float(self.max_inflight), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def _observe(self, latency: float) -> None:
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = self.latency_alpha * latency + (1 - self.latency_alpha) * self.latency
+        if self.best_latency is None or self.latency < self.best_latency:
+            self.best_latency = self.latency
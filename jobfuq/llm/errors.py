@@ -0,0 +1,55 @@
+"""
+Evaluation Errors Module
+
+Typed failures raised by AIModel so callers can tell a job worth retrying later from
+one that will never evaluate successfully.
+"""
+
+from typing import Optional
+
+# Client errors that are about the request itself (e.g. a prompt the provider rejects),
+# not about the key or the provider's health, so repeating them cannot succeed.
+PERMANENT_STATUSES = frozenset({400, 413, 422})
+RATE_LIMIT_STATUS = 429
+
+
+class TransientError(Exception):
+    """A failure that may succeed on retry: rate limits, 5xx, timeouts, connection errors."""
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status: Optional[int] = status
+
+
+class PermanentError(Exception):
+    """A failure that will repeat for the same job, e.g. a request the provider rejects outright."""
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status: Optional[int] = status
+
+
+def classify_error(ex: Exception) -> Exception:
+    """
+    Map a provider exception to TransientError or PermanentError, keeping its HTTP status.
+    """
+    if isinstance(ex, (TransientError, PermanentError)):
+        return ex
+    status = getattr(ex, "status", None) or getattr(ex, "status_code", None)
+    if isinstance(status, int) and status in PERMANENT_STATUSES:
+        return PermanentError(str(ex), status)
+    return TransientError(str(ex), status if isinstance(status, int) else None)
+
+
+def is_rate_limited(ex: BaseException) -> bool:
+    """Whether `ex` is a provider rate limit (HTTP 429) on the key that made the request."""
+    return getattr(ex, "status", None) == RATE_LIMIT_STATUS
+
+
+def should_retry(ex: BaseException) -> bool:
+    """
+    Retry predicate for a single key. Rate limits are not retried on the same key: they are
+    raised straight away so KeyPool can cool the key down and move on to the next one, or
+    wait out the cooldown when no other key is ready (e.g. a single Together key).
+    """
+    return not isinstance(ex, PermanentError) and not is_rate_limited(ex)
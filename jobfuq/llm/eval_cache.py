@@ -0,0 +1,107 @@
+"""
+Evaluation Cache Module
+
+This module defines the EvaluationCache class, an exact-match cache of AI evaluations
+stored in the job database. Entries are keyed by a hash of the fields that make up the
+prompt together with the scoring model and a profile digest (the prompt template and the
+kind of pass), so re-scored or duplicated postings skip the LLM round-trip entirely while
+a changed prompt, or a rescoring pass, never reuses another profile's evaluation.
+"""
+
+import hashlib
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from jobfuq.database.database import load_sql_queries
+from jobfuq.logger.logger import logger
+from jobfuq.utils.utils import json_dumps, json_loads
+
+# Job fields that are rendered into the evaluation prompt.
+PROMPT_FIELDS = ("company", "title", "location", "description")
+
+# Fields produced by an evaluation (see AIModel.extract_scores).
+EVALUATION_KEYS = (
+    "skills_match",
+    "experience_gap",
+    "model_fit_score",
+    "success_probability",
+    "role_complexity",
+    "effort_days_to_fit",
+    "critical_skill_mismatch_penalty",
+    "areas_for_development",
+    "reasoning",
+    "query_token_count",
+    "response_token_count",
+)
+
+ERROR_MARKER = "Error during evaluation"
+
+
+class EvaluationCache:
+    """
+    SQLite-backed exact-match cache for job evaluations.
+
+    Entries older than `ttl_seconds` are ignored on lookup and removed by `evict`, which
+    also trims the table to the `max_entries` most recently stored rows. Lookups are
+    read-only, so a cache hit never pays for a commit.
+    """
+
+    def __init__(
+            self,
+            conn: sqlite3.Connection,
+            profile: bytes = b"",
+            ttl_seconds: int = 30 * 86400,
+            max_entries: int = 50000
+    ) -> None:
+        self.conn: sqlite3.Connection = conn
+        self.profile: bytes = profile
+        self.ttl_seconds: int = ttl_seconds
+        self.max_entries: int = max_entries
+        self.queries: Dict[str, str] = load_sql_queries()
+        self.conn.execute(self.queries["create_eval_cache_table"])
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(job: Dict[str, Any], scoring_model: str, profile: bytes = b"") -> bytes:
+        # Stringified so the digest does not depend on which JSON backend is installed.
+        canonical: Dict[str, Optional[str]] = {
+            field: None if job.get(field) is None else str(job.get(field)) for field in PROMPT_FIELDS
+        }
+        h = hashlib.blake2b(json_dumps(canonical, sort_keys=True), digest_size=16)
+        h.update(scoring_model.encode("utf-8"))
+        h.update(b"\0" + profile)
+        return h.digest()
+
+    def get(self, job: Dict[str, Any], scoring_model: str) -> Optional[Dict[str, Any]]:
+        key: bytes = self.make_key(job, scoring_model, self.profile)
+        now: int = int(time.time())
+        try:
+            row = self.conn.execute(self.queries["get_cached_evaluation"], (key, now - self.ttl_seconds)).fetchone()
+            return json_loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning("Evaluation cache lookup failed: %s", e)
+            return None
+
+    def put(self, job: Dict[str, Any], scoring_model: str, evaluation: Dict[str, Any]) -> None:
+        if evaluation.get("areas_for_development") == ERROR_MARKER:
+            return
+        key: bytes = self.make_key(job, scoring_model, self.profile)
+        now: int = int(time.time())
+        payload: str = json_dumps({k: evaluation[k] for k in EVALUATION_KEYS if k in evaluation}).decode("utf-8")
+        try:
+            self.conn.execute(self.queries["put_cached_evaluation"], (key, scoring_model, payload, now, now))
+            self.conn.commit()
+        except Exception as e:
+            logger.warning("Evaluation cache store failed: %s", e)
+
+    def evict(self) -> None:
+        try:
+            cur = self.conn.execute(
+                self.queries["evict_eval_cache"], (int(time.time()) - self.ttl_seconds, self.max_entries)
+            )
+            self.conn.commit()
+            if cur.rowcount:
+                logger.debug("Evicted %s evaluation cache entries.", cur.rowcount)
+        except Exception as e:
+            logger.warning("Evaluation cache eviction failed: %s", e)
\ No newline at end of file
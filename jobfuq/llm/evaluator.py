@@ -1,6 +1,78 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple, Union
 from jobfuq.logger.logger import logger
 
 async def evaluate_job(ai_model: "AIModel", job: Dict[str, Any]) -> Dict[str, Any]:
     evaluation: Dict[str, Any] = await ai_model.evaluate_job_fit(job)
-    return {**job, **evaluation}
\ No newline at end of file
+    return {**job, **evaluation}
+
+async def evaluate_jobs(ai_model: "AIModel", jobs: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+    evaluations: List[Union[Dict[str, Any], Exception]] = await ai_model.evaluate_jobs_fit(jobs)
+    return [
+        {**job, **evaluation} if isinstance(evaluation, dict) else evaluation
+        for job, evaluation in zip(jobs, evaluations)
+    ]
+
+class EvaluationBatcher:
+    """
+    Collect jobs submitted by concurrent evaluators and send them to the model in batches.
+
+    A batch is flushed when it reaches `max_batch_size` jobs or when `max_wait_ms` has passed
+    since its first job arrived. Each submitter awaits its own future, which is resolved with
+    that job's evaluation once the batch completes.
+    """
+    def __init__(self, ai_model: "AIModel", max_batch_size: int, max_wait_ms: int) -> None:
+        self.ai_model = ai_model
+        self.max_batch_size: int = max(1, max_batch_size)
+        self.max_wait: float = max_wait_ms / 1000.0
+        self._queue: "asyncio.Queue[Tuple[Dict[str, Any], asyncio.Future]]" = asyncio.Queue()
+        self._collector: Optional[asyncio.Task] = None
+        self._flushes: set = set()
+
+    async def submit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, fut))
+        return await fut
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline: float = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        jobs = [job for job, _ in batch]
+        logger.debug("Flushing evaluation batch of %s jobs.", len(jobs))
+        try:
+            results = await evaluate_jobs(self.ai_model, jobs)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(batch, results):
+            if fut.done():
+                continue
+            if isinstance(result, BaseException):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
+    async def close(self) -> None:
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
\ No newline at end of file
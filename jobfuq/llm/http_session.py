@@ -0,0 +1,51 @@
+"""
+HTTP Session Module
+
+Holds the aiohttp session shared by all provider calls in a processing run, so
+requests reuse pooled keep-alive connections instead of paying a TCP/TLS
+handshake each time.
+"""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+_shared_session: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar("shared_session", default=None)
+
+
+@asynccontextmanager
+async def shared_http_session(threads: int = 1) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Open a pooled session and make it the current one for tasks started inside the block.
+
+    Args:
+        threads (int): Evaluation concurrency, used to size the connection pool.
+    """
+    threads = max(1, threads)
+    connector = aiohttp.TCPConnector(
+        limit=threads * 4,
+        limit_per_host=threads * 2,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        token = _shared_session.set(session)
+        try:
+            yield session
+        finally:
+            _shared_session.reset(token)
+
+
+@asynccontextmanager
+async def http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Yield the current shared session, or a short-lived one when none is open.
+    """
+    session = _shared_session.get()
+    if session is not None and not session.closed:
+        yield session
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
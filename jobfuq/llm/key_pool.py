@@ -0,0 +1,98 @@
+"""
+Key Pool Module
+
+Spreads evaluations over one AIModel per API key in round-robin order. A key that gets
+rate limited (HTTP 429) is skipped for a cooldown period, so the remaining keys keep
+their full throughput instead of every Nth request failing on the limited one. AIModel
+does not retry a 429 on the same key, so the request moves to the next key at once; when
+every key is cooling down (always the case with a single key), the pool waits for the
+first cooldown to end and tries again, up to `max_waits` times, before giving up.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Tuple, Union
+
+from jobfuq.llm.ai_model import AIModel
+from jobfuq.llm.errors import is_rate_limited
+from jobfuq.logger.logger import logger
+
+
+class KeyPool:
+    """
+    Drop-in stand-in for a single AIModel: exposes the same evaluate_job_fit and
+    evaluate_jobs_fit calls and routes each one to the next key that is not cooling down.
+    """
+
+    def __init__(self, models: List[AIModel], cooldown: float = 60.0, max_waits: int = 4) -> None:
+        if not models:
+            raise ValueError("KeyPool needs at least one model.")
+        self._pool: Deque[AIModel] = deque(models)
+        self._cooldown_until: Dict[AIModel, float] = {}
+        self.cooldown: float = cooldown
+        self.max_waits: int = max_waits
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    @property
+    def prompt_digest(self) -> bytes:
+        # Every key in a pool is built from the same config, so they share one prompt.
+        return self._pool[0].prompt_digest
+
+    def next(self) -> AIModel:
+        """
+        Return the next model in rotation, skipping keys that are cooling down. If every key
+        is cooling down, the one whose cooldown ends soonest is returned.
+        """
+        now = time.monotonic()
+        for _ in range(len(self._pool)):
+            model = self._pool[0]
+            self._pool.rotate(-1)
+            if self._cooldown_until.get(model, 0.0) <= now:
+                return model
+        return min(self._pool, key=lambda m: self._cooldown_until.get(m, 0.0))
+
+    def _observe(self, model: AIModel, ex: BaseException) -> bool:
+        """Start the key's cooldown if `ex` is a rate limit; return whether it was."""
+        if not is_rate_limited(ex):
+            return False
+        logger.warning("API key rate limited, cooling it down for %ss.", self.cooldown)
+        self._cooldown_until[model] = time.monotonic() + self.cooldown
+        return True
+
+    def _seconds_to_ready(self) -> float:
+        """Seconds until the first key leaves its cooldown (0 if one is ready now)."""
+        soonest = min(self._cooldown_until.get(m, 0.0) for m in self._pool)
+        return max(0.0, soonest - time.monotonic())
+
+    async def _call(self, call: Callable[[AIModel], Awaitable[Any]]) -> Tuple[AIModel, Any]:
+        # A rate-limited key is retried on the next ready key straight away. Once every key
+        # is cooling down, wait for the first to come back rather than failing the request.
+        waits = 0
+        while True:
+            model = self.next()
+            try:
+                return model, await call(model)
+            except Exception as e:
+                if not self._observe(model, e):
+                    raise
+                delay = self._seconds_to_ready()
+                if delay > 0:
+                    if waits >= self.max_waits:
+                        raise
+                    waits += 1
+                    logger.info("All API keys are rate limited, waiting %.0fs.", delay)
+                    await asyncio.sleep(delay)
+
+    async def evaluate_job_fit(self, job_info: Dict[str, Any]) -> Dict[str, Any]:
+        _, result = await self._call(lambda model: model.evaluate_job_fit(job_info))
+        return result
+
+    async def evaluate_jobs_fit(self, jobs: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        model, results = await self._call(lambda model: model.evaluate_jobs_fit(jobs))
+        for result in results:
+            if isinstance(result, BaseException) and self._observe(model, result):
+                break
+        return results
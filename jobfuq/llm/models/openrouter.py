@@ -11,8 +11,9 @@ import asyncio
 import time
 from typing import Any, Dict, List
 
-from openai import OpenAI
+from jobfuq.llm.http_session import http_session
 from jobfuq.logger.logger import logger
+from jobfuq.utils.utils import json_dumps, json_loads
 
 
 class OpenRouterModel:
@@ -65,14 +66,14 @@ class OpenRouterModel:
         """
         # ==== RATE LIMIT UPDATE SECTION ==== #
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 headers: Dict[str, str] = {"Authorization": f"Bearer {self.api_key}"}
                 async with session.get(
                         "https://openrouter.ai/api/v1/auth/key", headers=headers
                 ) as resp:
                     if resp.status == 200:
-                        data: Dict[str, Any] = await resp.json()
-                        logger.debug(f"Rate limit update response: {data}")
+                        data: Dict[str, Any] = await resp.json(loads=json_loads)
+                        logger.debug("Rate limit update response: %s", data)
                         # Assume data contains a "rate_limit" field in the format "10s"
                         rate_limit_str: str = data.get("rate_limit", "10s")
                         seconds: int = int(rate_limit_str.rstrip("s"))
@@ -83,7 +84,7 @@ class OpenRouterModel:
                             f"Rate limit update failed with status {resp.status}"
                         )
         except Exception as e:
-            logger.warning(f"Failed to update OpenRouter rate limit: {e}")
+            logger.warning("Failed to update OpenRouter rate limit: %s", e)
 
     async def _rate_limit(self) -> None:
         """
@@ -127,35 +128,46 @@ class OpenRouterModel:
         # ==== PROMPT EVALUATION SECTION ==== #
         await self._rate_limit()
 
-        client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=self.api_key,
-            default_headers={
-                "HTTP-Referer": "localhost",
-                "X-Title": "Job Analyzer",
-            },
-        )
-
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
-            model=self.model,
-            messages=[
+        headers: Dict[str, str] = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "localhost",
+            "X-Title": "Job Analyzer",
+        }
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [
                 {"role": "system", "content": self.system_message},
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.0,
-            max_tokens=max_tokens,
-        )
+            "temperature": 0.0,
+            "max_tokens": max_tokens,
+        }
+
+        async with http_session() as session:
+            async with session.post(
+                    "https://openrouter.ai/api/v1/chat/completions", headers=headers, data=json_dumps(payload)
+            ) as resp:
+                if resp.status != 200:
+                    error_text: str = await resp.text()
+                    logger.error("OpenRouter API failed %s: %s", resp.status, error_text)
+                    raise aiohttp.ClientResponseError(
+                        resp.request_info,
+                        resp.history,
+                        status=resp.status,
+                        message=f"OpenRouter API request failed: {resp.status}",
+                    )
+                response: Dict[str, Any] = await resp.json(loads=json_loads)
 
         # Add verbose logging to inspect response structure
-        logger.debug(f"OpenRouter API raw response: {response}")
+        logger.debug("OpenRouter API raw response: %s", response)
 
-        if response and hasattr(response, "choices") and response.choices:
-            result: str = response.choices[0].message.content
-            if result:
-                return result
+        choices: List[Dict[str, Any]] = response.get("choices") or [{}]
+        result: str = choices[0].get("message", {}).get("content")
+        if result:
+            return result
 
         # Log the entire response as error if structure is invalid
         logger.error("Invalid response structure from OpenRouter.")
-        logger.error(f"Received response: {response}")
+        logger.error("Received response: %s", response)
         raise Exception("Invalid response structure from OpenRouter.")
\ No newline at end of file
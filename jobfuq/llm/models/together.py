@@ -11,7 +11,9 @@ import asyncio
 import time
 from typing import Dict, Any
 
+from jobfuq.llm.http_session import http_session
 from jobfuq.logger.logger import logger
+from jobfuq.utils.utils import json_dumps, json_loads
 
 class TogetherModel:
     """
@@ -50,21 +52,21 @@ class TogetherModel:
         For the "deepseek-ai/DeepSeek-R1" model, the limit is forced to 6 RPM.
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 headers: Dict[str, str] = {"Authorization": f"Bearer {self.api_key}"}
                 async with session.get("https://api.together.ai/v1/auth/key", headers=headers) as resp:
                     if resp.status == 200:
-                        data: Dict[str, Any] = await resp.json()
+                        data: Dict[str, Any] = await resp.json(loads=json_loads)
                         rate_limit_str: str = data.get("rate_limit", "10s")
                         seconds: int = int(rate_limit_str.rstrip("s"))
                         new_limit: int = int(60 / seconds)
                         # If using the model-specific limit, enforce 6 RPM maximum.
                         if self.model == "deepseek-ai/DeepSeek-R1":
                             new_limit = min(new_limit, 6)
-                        logger.info(f"Together rate limit updated: {new_limit} RPM (based on {rate_limit_str}).")
+                        logger.info("Together rate limit updated: %s RPM (based on %s).", new_limit, rate_limit_str)
                         self.rpm_limit = new_limit
         except Exception as e:
-            logger.warning(f"Failed to update Together rate limit: {e}")
+            logger.warning("Failed to update Together rate limit: %s", e)
 
     async def _rate_limit(self) -> None:
         """
@@ -78,7 +80,7 @@ class TogetherModel:
             self._requests.pop(0)
         if len(self._requests) >= self.rpm_limit:
             sleep_time: float = self.window - (current_time - self._requests[0])
-            logger.debug(f"Together rate limiter sleeping for {sleep_time:.2f} seconds.")
+            logger.debug("Together rate limiter sleeping for %.2f seconds.", sleep_time)
             await asyncio.sleep(sleep_time)
         self._requests.append(time.time())
 
@@ -109,10 +111,10 @@ class TogetherModel:
         }
         # Merge any extra API parameters provided in the config.
         payload.update(self.extra_params)
-        async with aiohttp.ClientSession() as session:
-            async with session.post("https://api.together.xyz/v1/chat/completions", headers=headers, json=payload) as response:
+        async with http_session() as session:
+            async with session.post("https://api.together.xyz/v1/chat/completions", headers=headers, data=json_dumps(payload)) as response:
                 if response.status == 200:
-                    data: Dict[str, Any] = await response.json()
+                    data: Dict[str, Any] = await response.json(loads=json_loads)
                     result: str = data.get('choices', [{}])[0].get('message', {}).get('content')
                     if result:
                         # Optionally update rate limits based on response headers.
@@ -124,11 +126,16 @@ class TogetherModel:
                                 if self.model == "deepseek-ai/DeepSeek-R1":
                                     new_rpm = min(new_rpm, 6)
                                 if new_rpm != self.rpm_limit:
-                                    logger.info(f"Together rate limit adjusted via headers: {new_rpm} RPM.")
+                                    logger.info("Together rate limit adjusted via headers: %s RPM.", new_rpm)
                                     self.rpm_limit = new_rpm
                             except Exception as e:
-                                logger.debug(f"Failed to parse Together rate limit header: {e}")
+                                logger.debug("Failed to parse Together rate limit header: %s", e)
                         return result
                 error_text: str = await response.text()
-                logger.error(f"Together API failed {response.status}: {error_text}")
-                raise Exception(f"Together API request failed: {response.status}")
+                logger.error("Together API failed %s: %s", response.status, error_text)
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=f"Together API request failed: {response.status}",
+                )
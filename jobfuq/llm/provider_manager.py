@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
+import random
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from jobfuq.logger.logger import logger
 
 class ProviderManager:
@@ -14,33 +15,41 @@ class ProviderManager:
         elif mode == "multi":
             self.providers = ["together", "openrouter"]
         else:
-            logger.warning(f"Unknown provider_mode '{mode}', defaulting to 'together'")
+            logger.warning("Unknown provider_mode '%s', defaulting to 'together'", mode)
             self.providers = ["together"]
-        self.current_step: int = 1
-        self.together_jobs_remaining: int = 1
         self.failures: Dict[str, int] = {provider: 0 for provider in self.providers}
         self.cooldown_until: Dict[str, float] = {provider: 0.0 for provider in self.providers}
+        # Exponentially weighted moving average of response latency in seconds (0.0 = not measured yet).
+        self.latency: Dict[str, float] = {provider: 0.0 for provider in self.providers}
+        self.latency_alpha: float = 0.3
+        # Share of requests sent to a provider other than the fastest, so a provider slowed
+        # down by one outlier gets new samples and its average can recover.
+        self.explore_rate: float = 0.05
 
     def get_provider(self) -> str:
+        """
+        Route to the provider with the lowest observed latency that is not cooling down.
+        Providers without a measurement yet are tried first, and `explore_rate` of requests
+        probe another available provider; if every provider is cooling down, the one whose
+        cooldown expires soonest is returned.
+        """
         current_time: float = time.time()
-        if "openrouter" in self.providers:
-            if self.cooldown_until["openrouter"] > current_time:
-                if "together" in self.providers:
-                    return "together"
-                return "openrouter"
-            if "together" in self.providers and self.together_jobs_remaining > 0:
-                self.together_jobs_remaining -= 1
-                return "together"
-            elif "openrouter" in self.providers:
-                return "openrouter"
-        return self.providers[0]
+        available: List[str] = [p for p in self.providers if self.cooldown_until[p] <= current_time]
+        if not available:
+            return min(self.providers, key=lambda p: self.cooldown_until[p])
+        best: str = min(available, key=lambda p: self.latency[p])
+        if len(available) > 1 and random.random() < self.explore_rate:
+            return random.choice([p for p in available if p != best])
+        return best
 
-    def report_success(self, provider: str) -> None:
+    def report_success(self, provider: str, latency: Optional[float] = None) -> None:
         if provider in self.providers:
             self.failures[provider] = 0
-            if provider == "together":
-                self.together_jobs_remaining = self.current_step + 1
-            self.current_step += 1
+            if latency is not None:
+                prev: float = self.latency[provider]
+                self.latency[provider] = latency if prev == 0.0 else (
+                    self.latency_alpha * latency + (1 - self.latency_alpha) * prev
+                )
 
     def report_failure(self, provider: str) -> None:
         if provider in self.providers:
@@ -48,7 +57,5 @@ class ProviderManager:
             if self.failures[provider] >= 2:
                 self.cooldown_until[provider] = time.time() + 60
                 self.failures[provider] = 0
-                if "together" in self.providers:
-                    self.together_jobs_remaining = self.current_step + 1
         else:
-            logger.error(f"Failure reported for unknown provider '{provider}'.")
\ No newline at end of file
+            logger.error("Failure reported for unknown provider '%s'.", provider)
@@ -1,15 +1,29 @@
 # src/logger.py
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 def setup_logger(verbose=False):
     level = logging.DEBUG if verbose else logging.INFO
+    # Records are enqueued by the caller and written to stdout by a background listener thread,
+    # so logging large LLM responses does not block the event loop on I/O.
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        stream=sys.stdout
+        handlers=[queue_handler]
     )
     return logging.getLogger(__name__)
 
@@ -1,43 +1,104 @@
 #!/usr/bin/env python3
 import asyncio
 import argparse
+import contextlib
+import functools
+import random
 import sys
 import time
-from datetime import datetime
-from typing import Any, Dict, List
+from datetime import date
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 from rich.console import Console
-from jobfuq.utils.utils import load_config
+from jobfuq.utils.utils import load_config, run_async
 from jobfuq.llm.provider_manager import ProviderManager
-from jobfuq.llm.evaluator import evaluate_job
+from jobfuq.llm.evaluator import EvaluationBatcher, evaluate_job
 from jobfuq.llm.ai_model import AIModel
+from jobfuq.llm.key_pool import KeyPool
+from jobfuq.llm.dispatch_gate import DispatchGate
+from jobfuq.llm.errors import PermanentError, TransientError
+from jobfuq.llm.eval_cache import EVALUATION_KEYS, EvaluationCache
+from jobfuq.llm.http_session import shared_http_session
 from jobfuq.database.database import (
+    ScoreUpdate,
+    ScoreWriter,
+    bulk_update_preliminary_scores,
+    create_candidate_tables,
     create_connection,
-    get_job_ids_for_scoring,
-    get_job_ids_for_rescoring,
-    get_job_by_id,
-    update_job_scores
+    create_read_connection,
+    get_retry_counts,
+    get_scored_job_metrics,
+    mark_poison,
+    prefetch_rows,
+    schedule_job_retry,
+    iter_jobs_for_scoring,
+    iter_jobs_for_rescoring
 )
-from jobfuq.graphics.graphics import render_evaluation
+from jobfuq.graphics.graphics import EvaluationPrinter
 from jobfuq.logger.logger import logger, set_verbose
 
 console: Console = Console()
-retry_map: Dict[Any, float] = {}
-CONCURRENCY = 1
+# Evaluations in flight, keyed like the evaluation cache (job content, scoring model, profile).
+_inflight: Dict[bytes, asyncio.Future] = {}
+RETRY_DELAY = 180
+MAX_RETRY_DELAY = 3600
+MAX_RETRY_ATTEMPTS = 8
 
-def calculate_recency_score(job_date: str, max_days: int = 60) -> float:
+def _unwrap(ex: BaseException) -> BaseException:
+    last_attempt = getattr(ex, "last_attempt", None)  # Unwrap tenacity.RetryError.
+    if last_attempt is not None and last_attempt.failed:
+        return last_attempt.exception()
+    return ex
+
+def is_transient(ex: BaseException) -> bool:
+    """Return True for failures worth backing off on: TransientError, 429 and 5xx."""
+    ex = _unwrap(ex)
+    if isinstance(ex, TransientError):
+        return True
+    status = getattr(ex, "status", None) or getattr(ex, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+def schedule_retry(conn: Any, job_id: Any, reason: str, transient: bool = False) -> None:
+    """
+    Hold a failed job back with capped exponential backoff plus up to 10% jitter, so jobs
+    that keep failing are retried less and less often and do not retry in lockstep. After
+    MAX_RETRY_ATTEMPTS non-transient failures the job is skipped for good; transient ones
+    (rate limits, outages) only back off, so an exhausted quota never poisons the backlog.
+    """
+    attempts, failures = get_retry_counts(conn, job_id)
+    if not transient and failures >= MAX_RETRY_ATTEMPTS:
+        logger.error("⛔ Job %s failed %s times, skipping it from now on.", job_id, failures)
+        mark_poison(conn, job_id, f"retry limit reached: {reason}")
+        return
+    delay = min(RETRY_DELAY * (2 ** min(attempts, 5)), MAX_RETRY_DELAY)
+    schedule_job_retry(conn, job_id, delay + random.uniform(0, delay * 0.1), counts_failure=not transient)
+
+@functools.lru_cache(maxsize=4096)
+def _date_ordinal(job_date: str) -> int:
+    return date.fromisoformat(job_date).toordinal()
+
+def calculate_recency_score(job_date: str, max_days: int = 60, today_ord: Optional[int] = None) -> float:
     try:
-        d = (datetime.now() - datetime.strptime(job_date, "%Y-%m-%d")).days
+        if today_ord is None:
+            today_ord = date.today().toordinal()
+        d = today_ord - _date_ordinal(job_date)
         if d < 0:
             d = 0
         if d > max_days:
             return 0.0
-        return max(0.0, min(100.0, 100.0 * (1.0 - d / float(max_days))))
+        return 100.0 * (1.0 - d / float(max_days))
     except Exception as e:
-        logger.error(f"Error calculating recency score: {e}")
+        logger.error("Error calculating recency score: %s", e)
         return 0.0
 
+# Index = company size bucket (0..8+), as produced by the scraper's size_map.
+_CSIZE_LUT = (50.0, 45.0, 40.0, 100.0, 100.0, 100.0, 80.0, 60.0, 40.0)
+
 def calculate_company_size_score(sz: Any) -> float:
+    # Stored buckets are non-negative ints; anything else takes the general formula.
+    if type(sz) is int and sz >= 0:
+        return _CSIZE_LUT[min(sz, 8)]
     try:
         if 3 <= sz <= 5:
             return 100.0
@@ -78,59 +139,163 @@ def calculate_preliminary_score(
     score += rec_adj + csize_adj
     return max(0.0, min(score, 100.0))
 
+_METRICS_DTYPE = np.dtype([
+    ("id", np.int64), ("sm", np.float32), ("xp_gap", np.float32), ("sp", np.float32),
+    ("cpen", np.float32), ("applicants", np.float32), ("days", np.int32), ("csize", np.int64),
+])
+
+def _delta_days(job_date: str, today_ord: int, max_days: int) -> int:
+    try:
+        return today_ord - _date_ordinal(job_date)
+    except Exception:
+        return max_days + 1  # Unparseable dates score zero recency, as in calculate_recency_score.
+
+def bulk_rescore(conn: Any, scoring_model: Optional[str] = None, max_days: int = 60) -> int:
+    """
+    Recompute preliminary_score for already-evaluated jobs from their stored metrics, without
+    calling the AI. Returns the number of jobs updated.
+    """
+    # Imported here so scoring passes never pay for loading the JIT kernels.
+    from jobfuq.processing.score_kernel import company_size_score_vec, prelim_score_vec, recency_score_vec
+
+    today_ord = date.today().toordinal()
+    rows = np.fromiter(
+        (
+            (r[0], r[1], r[2], r[3], r[4], r[5], _delta_days(r[6], today_ord, max_days), r[7])
+            for r in get_scored_job_metrics(conn, scoring_model)
+        ),
+        dtype=_METRICS_DTYPE,
+    )
+    if not rows.size:
+        return 0
+
+    def col(name: str) -> np.ndarray:
+        return np.ascontiguousarray(rows[name])
+
+    scores = prelim_score_vec(
+        col("sm"), col("xp_gap"), col("cpen"), col("sp"), col("applicants"),
+        recency_score_vec(col("days"), max_days), company_size_score_vec(col("csize")),
+    )
+    bulk_update_preliminary_scores(conn, zip(np.rint(scores).astype(int).tolist(), rows["id"].tolist()))
+    return int(rows.size)
+
+async def evaluate_coalesced(
+        job: Dict[str, Any],
+        model: KeyPool,
+        scoring_model: str,
+        batcher: Optional[EvaluationBatcher] = None,
+        cache: Optional[EvaluationCache] = None,
+        profile: bytes = b""
+) -> Dict[str, Any]:
+    """
+    Evaluate a job, sharing the result with any concurrent task evaluating the same content
+    under the same scoring model and profile (e.g. duplicate postings).
+    """
+    key: bytes = EvaluationCache.make_key(job, scoring_model, profile)
+    pending: Optional[asyncio.Future] = _inflight.get(key)
+    if pending is not None:
+        shared: Dict[str, Any] = await asyncio.shield(pending)
+        return {**job, **shared} if shared else {}
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        ev = await batcher.submit(job) if batcher else await evaluate_job(model, job)
+        if ev and cache:
+            cache.put(job, scoring_model, ev)
+        fut.set_result({k: ev[k] for k in EVALUATION_KEYS if k in ev} if ev else {})
+        return ev
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # Mark as retrieved when nobody else was waiting.
+        raise
+    finally:
+        del _inflight[key]
+
 async def evaluate_and_update_job(
         job: Dict[str, Any],
-        model: AIModel,
+        model: KeyPool,
         conn: Any,
-        verbose: bool,
-        semaphore: asyncio.Semaphore,
-        scoring_model: str
-) -> Dict[str, Any]:
-    async with semaphore:
-        try:
-            recency = calculate_recency_score(job["date"])
-            app_count = job.get("applicants_count") or 0
-            ev = await evaluate_job(model, job)
-            if not ev:
-                logger.warning(f"No evaluation for job {job['id']}")
-                retry_map[job["id"]] = time.time() + 180
-                return {}
-            final_score = calculate_preliminary_score(
-                ev, recency, app_count, calculate_company_size_score(job.get("company_size_score", 0))
+        printer: Optional[EvaluationPrinter],
+        gate: DispatchGate,
+        scoring_model: str,
+        writer: ScoreWriter,
+        batcher: Optional[EvaluationBatcher] = None,
+        cache: Optional[EvaluationCache] = None,
+        today_ord: Optional[int] = None,
+        profile: bytes = b""
+) -> Optional[ScoreUpdate]:
+    """
+    Evaluate, score and queue the write for one job. The caller must already hold a slot
+    from `gate`; it is released here, with the outcome, once the job is done.
+    """
+    latency: Optional[float] = None
+    overloaded = False
+    try:
+        recency = calculate_recency_score(job["date"], today_ord=today_ord)
+        app_count = job.get("applicants_count") or 0
+        ev = cache.get(job, scoring_model) if cache else None
+        if ev:
+            logger.debug("Evaluation cache hit for job %s", job["id"])
+        else:
+            started = time.monotonic()
+            ev = await evaluate_coalesced(job, model, scoring_model, batcher, cache, profile)
+            latency = time.monotonic() - started
+        if not ev:
+            logger.warning("No evaluation for job %s", job["id"])
+            schedule_retry(conn, job["id"], "no evaluation")
+            return None
+        final_score = calculate_preliminary_score(
+            ev, recency, app_count, calculate_company_size_score(job.get("company_size_score", 0))
+        )
+        final_score_int = int(round(final_score))
+        update = ScoreUpdate.from_evaluation(job["id"], ev, final_score_int, scoring_model)
+        writer.put(update)
+        logger.info("✅ Job %s updated: Preliminary Score = %d", job["id"], final_score_int)
+        if printer:
+            # The full merged row is only needed for the panel.
+            printer.put(
+                {**job, **ev, "preliminary_score": final_score_int, "scoring_model": scoring_model},
+                recency, app_count
             )
-            final_score_int = int(round(final_score))
-            updated = {**job, **ev, "preliminary_score": final_score_int, "scoring_model": scoring_model}
-            update_job_scores(conn, job["id"], updated)
-            logger.info(f"✅ Job {job['id']} updated: Preliminary Score = {final_score_int}")
-            if verbose:
-                render_evaluation(updated, recency, app_count)
-            return updated
-        except Exception as ex:
-            logger.error(f"❌ Error processing job {job.get('id', 'Unknown')}: {ex}")
-            if job["id"] not in retry_map:
-                retry_map[job["id"]] = time.time() + 180
-            return {}
-
-async def process_and_rank_jobs(conf: Dict[str, Any], verbose: bool, threads: int, rescore: bool) -> List[Dict[str, Any]]:
-    conn = create_connection(conf)
-    provider_manager = ProviderManager(conf)
-    mode = conf.get("ai_providers", {}).get("provider_mode", "together").strip().lower()
+        return update
+    except Exception as ex:
+        if isinstance(_unwrap(ex), PermanentError):
+            logger.error("⛔ Job %s cannot be evaluated, skipping it from now on: %s", job["id"], ex)
+            mark_poison(conn, job["id"], str(ex))
+            return None
+        logger.error("❌ Error processing job %s: %s", job.get("id", "Unknown"), ex)
+        overloaded = is_transient(ex)
+        schedule_retry(conn, job["id"], str(ex), transient=overloaded)
+        return None
+    finally:
+        await gate.done(latency, overloaded)
+
+def build_model(conf: Dict[str, Any], rescore: bool) -> Tuple[KeyPool, str]:
+    """
+    Build the key pool used for scoring or rescoring passes, with one AIModel per configured
+    OpenRouter key, together with the scoring_model label stored with its results. Built once
+    per recipe and reused across passes, so provider cooldowns and latency estimates carry
+    over in endless mode.
+    """
+    # Per-recipe copy of the provider settings: scoring and rescoring run concurrently in
+    # "all" mode and must not overwrite each other's model or keys in the shared config.
+    ai_conf: Dict[str, Any] = dict(conf.get("ai_providers", {}))
+    mode = ai_conf.get("provider_mode", "together").strip().lower()
+    together_key = ai_conf.get("together_api_key", "").strip()
+    openrouter_keys = [k for k in ai_conf.get("openrouter_api_keys", []) if k]
     if mode == "together":
-        key = conf.get("ai_providers", {}).get("together_api_key", "").strip()
-        keys = [key] if key else []
+        keys = [together_key] if together_key else []
         if rescore:
-            rescoring_model = conf.get("ai_providers", {}).get("together_rescoring_model", "deepseek-ai/DeepSeek-R1")
-            conf["ai_providers"]["together_model"] = rescoring_model
+            ai_conf["together_model"] = ai_conf.get("together_rescoring_model", "deepseek-ai/DeepSeek-R1")
     elif mode == "openrouter":
-        keys = conf.get("ai_providers", {}).get("openrouter_api_keys", [])
+        keys = openrouter_keys
         if rescore:
-            rescoring_model = conf.get("ai_providers", {}).get("openrouter_rescoring_model", "defaultRescoringModel")
-            conf["ai_providers"]["openrouter_model"] = rescoring_model
+            ai_conf["openrouter_model"] = ai_conf.get("openrouter_rescoring_model", "defaultRescoringModel")
     elif mode == "multi":
-        keys = conf.get("ai_providers", {}).get("openrouter_api_keys", [])
-        together_key = conf.get("ai_providers", {}).get("together_api_key", "").strip()
-        if together_key:
-            keys.append(together_key)
+        keys = openrouter_keys + ([together_key] if together_key else [])
     else:
         keys = []
 
@@ -138,78 +303,161 @@ async def process_and_rank_jobs(conf: Dict[str, Any], verbose: bool, threads: in
         logger.error("❌ No AI keys found. Exiting.")
         sys.exit(1)
 
-    if rescore:
-        job_ids = get_job_ids_for_rescoring(conn)
-        logger.info(f"Rescoring mode: found {len(job_ids)} jobs.")
-    else:
-        job_ids = get_job_ids_for_scoring(conn)
-        logger.info(f"Scoring mode: found {len(job_ids)} jobs.")
-
-    if not job_ids:
-        logger.info("No jobs found. Waiting 30 seconds before next pass.")
-        await asyncio.sleep(30)
-        return []
-
     if mode == "together":
-        scoring_model = f"Together/{conf.get('ai_providers', {}).get('together_model', 'deepseek-ai/DeepSeek-R1')}"
+        scoring_model = f"Together/{ai_conf.get('together_model', 'deepseek-ai/DeepSeek-R1')}"
     elif mode == "openrouter":
-        scoring_model = f"OpenRouter/{conf.get('ai_providers', {}).get('openrouter_model', 'defaultOpenRouterModel')}"
+        scoring_model = f"OpenRouter/{ai_conf.get('openrouter_model', 'defaultOpenRouterModel')}"
     else:
         scoring_model = mode.capitalize()
 
-    sc = dict(conf)
-    if mode in ["together", "multi"]:
-        sc["ai_providers"]["together_api_key"] = keys[0]
-    elif mode == "openrouter":
-        sc["ai_providers"]["openrouter_api_keys"] = [keys[0]]
-    model = AIModel(sc, provider_manager)
-
-    semaphore = asyncio.Semaphore(CONCURRENCY)
-    tasks = []
-    for job_id in job_ids:
-        now_ts = time.time()
-        if (job_id in retry_map) and (now_ts < retry_map[job_id]):
-            continue
-        job = get_job_by_id(conn, job_id)
-        if not job:
-            continue
-        tasks.append(evaluate_and_update_job(job, model, conn, verbose, semaphore, scoring_model))
-    results = []
-    if tasks:
-        results = await asyncio.gather(*tasks)
-    else:
-        logger.info("No jobs processed in this cycle.")
-    await asyncio.sleep(1)
-    return [r for r in results if r]
+    ai_conf["together_api_key"] = together_key
+    # Together takes a single key; each OpenRouter key gets its own model, rate limiter
+    # and provider health in the pool.
+    models: List[AIModel] = []
+    for key in openrouter_keys if mode in ("openrouter", "multi") and openrouter_keys else [None]:
+        key_conf = dict(ai_conf)
+        if key is not None:
+            key_conf["openrouter_api_keys"] = [key]
+        sc = {**conf, "ai_providers": key_conf}
+        models.append(AIModel(sc, ProviderManager(sc)))
+    logger.info("Using %s API key(s) for %s.", len(models), scoring_model)
+    return KeyPool(models), scoring_model
 
-async def main(config_path: str, verbose: bool, endless: bool, threads: int, recipe: str) -> None:
+async def process_and_rank_jobs(
+        conf: Dict[str, Any],
+        verbose: bool,
+        threads: int,
+        rescore: bool,
+        model: KeyPool,
+        scoring_model: str,
+        use_cache: bool = True
+) -> int:
+    """
+    Score (or rescore) every candidate job and return how many evaluations were stored.
+    """
+    ai_conf: Dict[str, Any] = conf.get("ai_providers", {})
+    conn = create_connection(conf)
+    # Multi mode labels both passes with the same scoring model, so the pass kind is part of
+    # the profile: a rescoring pass must never be answered with the scoring pass's result.
+    profile = model.prompt_digest + (b"rescore" if rescore else b"score")
+    cache = None
+    if use_cache:
+        cache = EvaluationCache(conn, profile, ttl_seconds=int(ai_conf.get("eval_cache_ttl_days", 30)) * 86400)
+        cache.evict()
+
+    batch_size = max(1, int(ai_conf.get("eval_batch_size", 1)))
+    batcher = None
+    if batch_size > 1:
+        batcher = EvaluationBatcher(model, batch_size, int(ai_conf.get("eval_batch_wait_ms", 200)))
+    # Each concurrency slot holds one full batch of jobs; the gate adapts below that ceiling.
+    gate = DispatchGate(max(1, threads) * batch_size)
+    today_ord = date.today().toordinal()
+    # Score batches commit from a worker thread, on a connection of their own.
+    score_conn = create_connection(conf, check_same_thread=False)
+    writer = ScoreWriter(score_conn)
+    printer = EvaluationPrinter() if verbose else None
+    # Candidates are read on their own connection in a worker thread, one chunk ahead of
+    # dispatch, so the SELECT overlaps with requests already in flight.
+    read_conn = create_read_connection(conf)
+    rows = iter_jobs_for_rescoring(read_conn) if rescore else iter_jobs_for_scoring(read_conn)
+    # Finished tasks drop out of `pending` as they complete, so memory stays bounded by the
+    # in-flight window rather than growing with the number of jobs in the pass.
+    pending: Set[asyncio.Task] = set()
+    dispatched = 0
+    scored = 0
+
+    def collect(task: asyncio.Task) -> None:
+        nonlocal scored
+        pending.discard(task)
+        if task.cancelled():
+            return
+        # A task that fails must not cancel its siblings and throw away evaluations that
+        # were already paid for; failures are logged and everything else is kept.
+        if task.exception() is not None:
+            logger.error("❌ Unhandled error in evaluation task: %s", task.exception())
+        elif task.result() is not None:
+            scored += 1
+
+    try:
+        # Rolling dispatch: take the next row only once a slot frees up, so a slow response
+        # never holds back the jobs behind it.
+        async for job in prefetch_rows(rows):
+            await gate.wait()
+            task = asyncio.create_task(evaluate_and_update_job(
+                job, model, conn, printer, gate, scoring_model, writer, batcher, cache, today_ord, profile
+            ))
+            pending.add(task)
+            task.add_done_callback(collect)
+            dispatched += 1
+        logger.info("%s mode: dispatched %s jobs.", "Rescoring" if rescore else "Scoring", dispatched)
+        if not dispatched:
+            logger.info("No jobs found. Waiting 30 seconds before next pass.")
+            await asyncio.sleep(30)
+            return 0
+        if pending:
+            await asyncio.wait(set(pending))
+    finally:
+        for task in list(pending):
+            task.cancel()  # Only stragglers left behind if dispatch itself failed.
+        if batcher:
+            await batcher.close()
+        await writer.close()
+        score_conn.close()
+        if printer:
+            await printer.close()
+        read_conn.close()
+        conn.close()
+    return scored
+
+async def main(
+        config_path: str, verbose: bool, endless: bool, threads: int, recipe: str, use_cache: bool = True
+) -> None:
     console.print("[bold blue]🚀 Starting Processor[/bold blue]")
     try:
         conf = load_config(config_path)
         set_verbose(verbose)
+        # Side tables the candidate queries, retry bookkeeping and score writes rely on,
+        # created once on a write connection: passes read candidates on a query_only one.
+        with contextlib.closing(create_connection(conf)) as setup_conn:
+            create_candidate_tables(setup_conn)
+        threads = threads or conf.get("ai_providers", {}).get("threads", 1)
         recipe = recipe.lower() if recipe else "all"
-        while True:
-            if recipe == "scoring":
-                scored = await process_and_rank_jobs(conf, verbose, threads, rescore=False)
-                logger.info(f"Scoring mode processed {len(scored)} jobs.")
-            elif recipe == "rescoring":
-                rescored = await process_and_rank_jobs(conf, verbose, threads, rescore=True)
-                logger.info(f"Rescoring mode processed {len(rescored)} jobs.")
-            elif recipe == "all":
-                scoring_task = asyncio.create_task(process_and_rank_jobs(conf, verbose, threads, rescore=False))
-                rescoring_task = asyncio.create_task(process_and_rank_jobs(conf, verbose, threads, rescore=True))
-                results = await asyncio.gather(scoring_task, rescoring_task)
-                scored, rescored = results
-                logger.info(f"All mode: Scoring processed {len(scored)} jobs; Rescoring processed {len(rescored)} jobs.")
-            else:
-                logger.error(f"Unknown recipe '{recipe}'. Use scoring, rescoring, or all.")
-                sys.exit(1)
-            if not endless:
-                break
-            logger.info("🔄 Waiting 60 seconds before next pass...")
-            await asyncio.sleep(60)
+        # Models are built lazily on first use and reused by every later pass.
+        models: Dict[bool, Tuple[KeyPool, str]] = {}
+
+        async def run_pass(rescore: bool) -> int:
+            if rescore not in models:
+                models[rescore] = build_model(conf, rescore)
+            model, scoring_model = models[rescore]
+            return await process_and_rank_jobs(conf, verbose, threads, rescore, model, scoring_model, use_cache)
+
+        async with shared_http_session(threads):
+            while True:
+                if recipe == "scoring":
+                    scored = await run_pass(rescore=False)
+                    logger.info("Scoring mode processed %s jobs.", scored)
+                elif recipe == "rescoring":
+                    rescored = await run_pass(rescore=True)
+                    logger.info("Rescoring mode processed %s jobs.", rescored)
+                elif recipe == "recalc":
+                    with contextlib.closing(create_connection(conf)) as recalc_conn:
+                        recalculated = bulk_rescore(recalc_conn)
+                    logger.info("Recalc mode recomputed %s stored scores.", recalculated)
+                elif recipe == "all":
+                    async with asyncio.TaskGroup() as tg:
+                        scoring_task = tg.create_task(run_pass(rescore=False))
+                        rescoring_task = tg.create_task(run_pass(rescore=True))
+                    scored, rescored = scoring_task.result(), rescoring_task.result()
+                    logger.info("All mode: Scoring processed %s jobs; Rescoring processed %s jobs.", scored, rescored)
+                else:
+                    logger.error("Unknown recipe '%s'. Use scoring, rescoring, recalc, or all.", recipe)
+                    sys.exit(1)
+                if not endless:
+                    break
+                logger.info("🔄 Waiting 60 seconds before next pass...")
+                await asyncio.sleep(60)
     except Exception as e:
-        logger.error(f"Fatal error in main: {e}")
+        logger.error("Fatal error in main: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -219,8 +467,9 @@ if __name__ == "__main__":
     parser.add_argument("config", nargs="?", default="jobfuq/conf/config.toml", help="Path to config file")
     parser.add_argument("-v", "--verbose", action="store_true", help="Increase output verbosity")
     parser.add_argument("--endless", action="store_true", help="Run in endless mode (loop forever)")
-    parser.add_argument("--threads", type=int, default=1, help="Number of concurrent evaluations")
-    parser.add_argument("--recipe", type=str, default="all", help="Recipe mode: scoring/rescoring/all [default=all]")
+    parser.add_argument("--threads", type=int, default=None, help="Number of concurrent evaluations [default: ai_providers.threads or 1]")
+    parser.add_argument("--recipe", type=str, default="all", help="Recipe mode: scoring/rescoring/recalc/all [default=all]")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the evaluation cache and always query the AI")
     args = parser.parse_args()
 
-    asyncio.run(main(args.config, args.verbose, args.endless, args.threads, args.recipe))
\ No newline at end of file
+    run_async(main(args.config, args.verbose, args.endless, args.threads, args.recipe, not args.no_cache))
\ No newline at end of file
@@ -0,0 +1,116 @@
+# jobfuq/processing/score_kernel.py
+
+"""
+Vectorized preliminary scoring over struct-of-arrays inputs.
+
+Mirrors the scalar helpers in processor.py for bulk re-ranking of stored
+evaluations. With numba the kernels are explicit loops compiled to parallel
+SIMD code; without it the same math runs as whole-array NumPy ufunc calls,
+never as an interpreted per-element loop.
+
+Compiled kernels are cached on disk (see NUMBA_CACHE_DIR), so only the first
+process to import this module pays the JIT cost. Run
+`python -m jobfuq.processing.score_kernel` once after install to populate the
+cache ahead of time.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Fall back to the NumPy implementations below.
+    numba = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+def _jit(fallback):
+    """Compile the decorated loop kernel with numba, or use `fallback` when numba is absent."""
+    def wrap(fn):
+        if NUMBA_AVAILABLE:
+            return numba.njit(parallel=True, fastmath=True, cache=True)(fn)
+        return fallback
+    return wrap
+
+
+# Index = min(company_size, 8) for non-negative sizes; negative sizes score 50 - 5 * size,
+# as in calculate_company_size_score.
+CSIZE_LUT = np.array([50, 45, 40, 100, 100, 100, 80, 60, 40], dtype=np.float32)
+
+
+
+def _company_size_score_np(sz):
+    neg = (50.0 - 5.0 * sz).astype(np.float32)
+    return np.where(sz < 0, neg, CSIZE_LUT[np.clip(sz, 0, 8)])
+
+
+def _recency_score_np(delta_days, max_days):
+    d = np.maximum(delta_days, 0)
+    rec = 100.0 * (1.0 - d * (1.0 / max_days))
+    return np.where(d > max_days, 0.0, rec).astype(np.float32)
+
+
+def _prelim_score_np(sm, xp_gap, cpen, sp, applicants, rec, csize):
+    base = np.maximum(sm - np.minimum(xp_gap + cpen, 80.0), 1.0)
+    score = base * (sp / 100.0)
+    score *= np.maximum(100.0 - np.minimum(applicants, 500.0) * 0.2, 0.0) / 100.0
+    score += (rec - 50.0) * 0.2 + (csize - 50.0) * 0.1
+    return np.clip(score, 0.0, 100.0).astype(np.float32)
+
+
+@_jit(_company_size_score_np)
+def company_size_score_vec(sz):
+    out = np.empty(sz.shape[0], dtype=np.float32)
+    for i in prange(sz.shape[0]):
+        s = sz[i]
+        if s < 0:
+            out[i] = 50.0 - 5.0 * s
+        else:
+            out[i] = CSIZE_LUT[min(s, 8)]
+    return out
+
+
+@_jit(_recency_score_np)
+def recency_score_vec(delta_days, max_days):
+    out = np.empty(delta_days.shape[0], dtype=np.float32)
+    inv = 1.0 / max_days
+    for i in prange(delta_days.shape[0]):
+        d = delta_days[i]
+        if d < 0:
+            d = 0
+        if d > max_days:
+            out[i] = 0.0
+        else:
+            out[i] = 100.0 * (1.0 - d * inv)
+    return out
+
+
+@_jit(_prelim_score_np)
+def prelim_score_vec(sm, xp_gap, cpen, sp, applicants, rec, csize):
+    out = np.empty(sm.shape[0], dtype=np.float32)
+    for i in prange(sm.shape[0]):
+        penalty = min(80.0, xp_gap[i] + cpen[i])
+        base = max(1.0, sm[i] - penalty)
+        score = base * (sp[i] / 100.0)
+        score *= max(0.0, 100.0 - min(applicants[i], 500.0) * 0.2) / 100.0
+        score += (rec[i] - 50.0) * 0.2 + (csize[i] - 50.0) * 0.1
+        out[i] = max(0.0, min(score, 100.0))
+    return out
+
+
+def _warmup() -> None:
+    # Same argument types as processor.bulk_rescore, so the cached signatures are the ones used.
+    f = np.zeros(8, dtype=np.float32)
+    company_size_score_vec(np.zeros(8, dtype=np.int64))
+    recency_score_vec(np.zeros(8, dtype=np.int32), 60)
+    prelim_score_vec(f, f, f, f, f, f, f)
+
+
+if NUMBA_AVAILABLE:
+    _warmup()
+
+
+if __name__ == "__main__":
+    print("Score kernels " + ("compiled and cached." if NUMBA_AVAILABLE else "running without numba."))
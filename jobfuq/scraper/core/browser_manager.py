@@ -0,0 +1,92 @@
+"""
+Browser Manager Module
+
+One Playwright browser shared by the scraper flows, with one logged-in context per LinkedIn
+account kept open between uses. The orchestrator runs several flows back to back; sharing
+the manager means the browser is launched once and each account logs in once per process,
+instead of every flow paying for its own launch, context setup and login.
+"""
+
+import asyncio
+import os
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from playwright.async_api import async_playwright
+
+from jobfuq.logger.logger import logger
+from jobfuq.scraper.core.linked_utils import block_resources_cdp, ensure_logged_in, launch_browser, session_path
+
+# Jittered around 1280x720 so contexts don't all share one window size.
+VIEWPORTS = tuple(
+    {'width': 1280 + dx, 'height': 720 + dy} for dx in range(-50, 51, 5) for dy in range(-30, 31, 5)
+)
+
+
+class BrowserManager:
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.config = config
+        self.user_agents = tuple(config.get('user_agents', ['Mozilla/5.0']))
+        self.playwright: Any = None
+        self.browser: Any = None
+        self._pages: Dict[str, Any] = {}  # username -> logged-in page
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def initialize(self) -> None:
+        if self.browser is None:
+            self.playwright = await async_playwright().start()
+            self.browser = await launch_browser(self.playwright, self.config.get("headless", False))
+
+    @asynccontextmanager
+    async def acquire(self, creds: Dict[str, str]) -> AsyncIterator[Optional[Any]]:
+        """
+        Yield the logged-in page for `creds`, logging in on first use (None if login fails).
+        An account's context is used by one holder at a time and stays open on release.
+        """
+        username: str = creds["username"]
+        async with self._locks.setdefault(username, asyncio.Lock()):
+            page = self._pages.get(username)
+            if page is None or page.is_closed():
+                page = await self._login(creds)
+                if page is not None:
+                    self._pages[username] = page
+            yield page
+
+    async def _login(self, creds: Dict[str, str]) -> Optional[Any]:
+        await self.initialize()
+        # Seed the context with the account's saved session (cookies and localStorage), so a
+        # still-valid session comes up logged in without the login navigations.
+        state: str = session_path(creds['username'])
+        seeded: bool = os.path.exists(state)
+        context = await self.browser.new_context(
+            viewport=random.choice(VIEWPORTS),
+            user_agent=random.choice(self.user_agents),
+            storage_state=state if seeded else None
+        )
+        page = await context.new_page()
+        await block_resources_cdp(page)
+        username, password = creds['username'], creds['password']
+        logger.info("Logging in with: %s", username)
+        logged_in_page = await ensure_logged_in(
+            page, username, password, self.playwright, self.config, session_seeded=seeded
+        )
+        if not logged_in_page:
+            logger.error("Login failed for %s.", username)
+            await context.close()
+            return None
+        return logged_in_page  # Use the page returned after successful login
+
+    async def shutdown(self) -> None:
+        for page in self._pages.values():
+            try:
+                await page.context.close()
+            except Exception as e:
+                logger.debug("Error closing context: %s", e)
+        self._pages.clear()
+        if self.browser is not None:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
@@ -1,4 +1,5 @@
 import difflib
+import re
 
 job_filter_config = {
     "roles_positive": [
@@ -62,16 +63,44 @@ def fuzzy_contains(text, pattern, threshold=0.85):
     First checks for an exact substring; if not found, it splits the text into words
     and compares each word with the pattern using difflib.SequenceMatcher.
     """
-    text = text.lower()
-    pattern = pattern.lower()
-    if pattern in text:
-        return True
-    words = text.split()
-    for word in words:
-        similarity = difflib.SequenceMatcher(None, word, pattern).ratio()
-        if similarity >= threshold:
+    return TermMatcher([pattern], threshold).search(text)
+
+class TermMatcher:
+    """
+    A list of filter terms precompiled for repeated fuzzy_contains-style matching.
+
+    Exact substrings of every term are found with one regex scan. Only if none is present
+    are the text's distinct words compared with each term, reusing one SequenceMatcher per
+    term and skipping words whose length alone rules out reaching the threshold.
+    """
+    def __init__(self, terms, threshold=0.85):
+        self.threshold = threshold
+        terms = [t.lower() for t in terms if t]
+        self.exact = re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))) if terms else None
+        self.matchers = [(len(t), difflib.SequenceMatcher(None, "", t)) for t in terms]
+
+    def search(self, text):
+        return self.search_lower(text.lower()) if text else False
+
+    def search_lower(self, text):
+        """search() for text the caller has already lowercased."""
+        if not text or self.exact is None:
+            return False
+        if self.exact.search(text):
             return True
-    return False
+        th = self.threshold
+        words = set(text.split())
+        for term_len, matcher in self.matchers:
+            for word in words:
+                # ratio() can never exceed 2*min/(sum of lengths).
+                if 2 * min(len(word), term_len) < th * (len(word) + term_len):
+                    continue
+                matcher.set_seq1(word)
+                if matcher.real_quick_ratio() >= th and matcher.quick_ratio() >= th and matcher.ratio() >= th:
+                    return True
+        return False
+
+_MATCHERS = {key: TermMatcher(terms, 0.85) for key, terms in job_filter_config.items()}
 
 def insert_blacklisted_job(conn, title, job_url):
     """
@@ -97,45 +126,28 @@ def passes_filter(title, description, db_conn=None, job_url=None):
             insert_blacklisted_job(db_conn, title, job_url)
         return False
 
+    # Lowercased once here; every matcher below gets the already-lowered text.
     t = title.lower()
     d = description.lower() if description else ""
-    cfg = job_filter_config
-
-    # Reject if any stop word fuzzy-matches (85% or higher) in title or description.
-    for word in cfg.get("stop_words", []):
-        if fuzzy_contains(t, word, 0.85) or fuzzy_contains(d, word, 0.85):
-            if db_conn is not None and job_url is not None:
-                insert_blacklisted_job(db_conn, title, job_url)
-            return False
-
-    # Must have at least one positive role term.
-    if not any(fuzzy_contains(t, r, 0.85) for r in cfg.get("roles_positive", [])):
-        if db_conn is not None and job_url is not None:
-            insert_blacklisted_job(db_conn, title, job_url)
-        return False
-
-    # Reject if any negative role term fuzzy-matches.
-    if any(fuzzy_contains(t, rn, 0.85) for rn in cfg.get("roles_negative", [])):
-        if db_conn is not None and job_url is not None:
-            insert_blacklisted_job(db_conn, title, job_url)
-        return False
-
-    # Must have at least one positive type term.
-    if not any(fuzzy_contains(t, tp, 0.85) for tp in cfg.get("types_positive", [])):
-        if db_conn is not None and job_url is not None:
-            insert_blacklisted_job(db_conn, title, job_url)
-        return False
-
-    # Reject if any negative type term fuzzy-matches.
-    if any(fuzzy_contains(t, tn, 0.85) for tn in cfg.get("types_negative", [])):
-        if db_conn is not None and job_url is not None:
-            insert_blacklisted_job(db_conn, title, job_url)
-        return False
-
-    # Reject if any negative seniority term fuzzy-matches.
-    if any(fuzzy_contains(t, sn, 0.85) for sn in cfg.get("seniority_negative", [])):
+    m = _MATCHERS
+
+    rejected = (
+        # Reject if any stop word fuzzy-matches (85% or higher) in title or description.
+        m["stop_words"].search_lower(t) or m["stop_words"].search_lower(d)
+        # Must have at least one positive role term.
+        or not m["roles_positive"].search_lower(t)
+        # Reject if any negative role term fuzzy-matches.
+        or m["roles_negative"].search_lower(t)
+        # Must have at least one positive type term.
+        or not m["types_positive"].search_lower(t)
+        # Reject if any negative type term fuzzy-matches.
+        or m["types_negative"].search_lower(t)
+        # Reject if any negative seniority term fuzzy-matches.
+        or m["seniority_negative"].search_lower(t)
+    )
+    if rejected:
         if db_conn is not None and job_url is not None:
             insert_blacklisted_job(db_conn, title, job_url)
         return False
 
-    return True
\ No newline at end of file
+    return True
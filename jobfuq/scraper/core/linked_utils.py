@@ -1,14 +1,15 @@
-import json
 import random
 import asyncio
+import logging
 import re
 import os
+import time
 from typing import Any, Dict, List, Optional
 from playwright.async_api import Route, Request, BrowserType
 from faker import Faker
 
 from jobfuq.logger.logger import logger
-from jobfuq.utils.utils import load_config
+from jobfuq.utils.utils import json_loads, load_config
 
 # Session storage directory
 SESSION_STORE_DIR: str = "session_store"
@@ -18,7 +19,7 @@ try:
     if session_override:
         SESSION_STORE_DIR = session_override
 except Exception as e:
-    logger.debug(f"Could not load session override from main config: {e}")
+    logger.debug("Could not load session override from main config: %s", e)
 
 os.makedirs(SESSION_STORE_DIR, exist_ok=True)
 
@@ -48,6 +49,21 @@ async def create_stealth_browser(browser_type: BrowserType) -> Any:
     )
 
 
+async def launch_browser(playwright: Any, headless: bool) -> Any:
+    """
+    Launch Chromium for a scraper flow with the flags from linked_config.toml ([browser_args]
+    and [browser_launch]).
+    """
+    b_args: Dict[str, Any] = linked_config.get("browser_args", {})
+    launch_conf: Dict[str, Any] = linked_config.get("browser_launch", {})
+    args: List[str] = [
+        f"--disable-blink-features={b_args.get('disable_blink_features', 'AutomationControlled')}",
+        f"--disable-features={b_args.get('disable_features', 'IsolateOrigins,site-per-process')}",
+        *launch_conf.get("args", ["--blink-settings=imagesEnabled=false", "--disable-dev-shm-usage"]),
+    ]
+    return await playwright.chromium.launch(headless=headless, slow_mo=launch_conf.get("slow_mo", 0), args=args)
+
+
 async def apply_stealth_scripts(page: Any) -> None:
     # Prevent WebRTC leaks
     await page.add_init_script("() => { window.RTCPeerConnection = undefined; }")
@@ -55,18 +71,63 @@ async def apply_stealth_scripts(page: Any) -> None:
     await page.add_init_script("() => { window.AudioContext = undefined; }")
 
 
+_rb_conf: Dict[str, Any] = linked_config.get("resource_blocking", {})
+BLOCKED_RESOURCE_TYPES: frozenset = frozenset(_rb_conf.get("types", ["image", "font", "media"]))
+_blocked_exts: List[str] = list(_rb_conf.get("extensions", []))
+# Wildcard URL patterns for CDP: each extension with and without a query string, plus extras.
+BLOCKED_URL_PATTERNS: List[str] = list(_rb_conf.get("url_patterns", [])) + [
+    p for ext in _blocked_exts for p in (f"*.{ext}", f"*.{ext}?*")
+]
+
+
+def _wildcard_regex(pattern: str) -> str:
+    """Translate a CDP wildcard pattern into an equivalent regex for re.search."""
+    body: str = ".*".join(map(re.escape, pattern.strip("*").split("*")))
+    return ("" if pattern.startswith("*") else "^") + body + ("" if pattern.endswith("*") else "$")
+
+
+# The same patterns as one regex, for the page.route fallback: only matching requests
+# reach Python at all, and they are aborted without further checks. Extensions share a
+# single alternation group, so each URL is scanned once rather than once per pattern.
+BLOCKED_URL_RE: "re.Pattern[str]" = re.compile(
+    "|".join(
+        ([r"\.(?:" + "|".join(map(re.escape, _blocked_exts)) + r")(?:\?|$)"] if _blocked_exts else [])
+        + [_wildcard_regex(p) for p in _rb_conf.get("url_patterns", [])]
+    ) or "(?!)",
+    re.IGNORECASE,
+)
+
+
 async def block_resources(route: Route, request: Request) -> None:
-    block_types: List[str] = linked_config.get("resource_blocking", {}).get("types", ["image", "font", "media"])
-    if request.resource_type in block_types:
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
         await route.abort()
     else:
         await route.continue_()
 
 
+async def _abort_route(route: Route) -> None:
+    await route.abort()
+
+
+async def block_resources_cdp(page: Any) -> None:
+    """
+    Block heavy resources for `page` inside the browser with CDP Network.setBlockedURLs, so
+    requests are matched in native code instead of round-tripping through a Python route
+    handler. Where CDP is unavailable, falls back to a route that only matches those URLs.
+    """
+    try:
+        client = await page.context.new_cdp_session(page)
+        await client.send("Network.enable")
+        await client.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.debug("CDP resource blocking unavailable (%s); using route handler.", e)
+        await page.route(BLOCKED_URL_RE, _abort_route)
+
+
 async def random_network_throttling(page: Any) -> None:
     profiles: List[str] = linked_config.get("network_profiles", {}).get("profiles", ["Wi-Fi", "Regular4G", "DSL"])
     chosen: str = random.choice(profiles)
-    logger.debug(f"[STEALTH] Applying random network profile: {chosen}")
+    logger.debug("[STEALTH] Applying random network profile: %s", chosen)
     await page.context.set_geolocation({
         "latitude": random.uniform(-90, 90),
         "longitude": random.uniform(-180, 180),
@@ -83,9 +144,11 @@ async def fake_http_traffic(page: Any) -> None:
                 "Accept": "text/html,application/xhtml+xml",
             },
         )
-        logger.debug(f"Fake HTTP traffic response: {response.status} - {await response.text()}")
+        # Only pull the body over from the browser when it will actually be logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fake HTTP traffic response: %s - %s", response.status, await response.text())
     except Exception as e:
-        logger.debug(f"Fake HTTP traffic error: {e}")
+        logger.debug("Fake HTTP traffic error: %s", e)
 
 
 async def generate_realistic_mouse_physics(page: Any) -> None:
@@ -172,7 +235,7 @@ async def handle_manual_captcha(page: Any, playwright: Any, config: Dict[str, An
         updated_state = await context_headful.storage_state()
         await browser_headful.close()
         logger.info("Captcha solved. Relaunching headless browser with updated session state.")
-        headless_browser = await playwright.chromium.launch(headless=True, slow_mo=50)
+        headless_browser = await launch_browser(playwright, headless=True)
         new_context = await headless_browser.new_context(storage_state=updated_state)
         new_page2 = await new_context.new_page()
         feed_url: str = linked_config.get("urls", {}).get("feed_url", "https://www.linkedin.com/feed/")
@@ -234,36 +297,61 @@ async def move_mouse_and_click(page: Any, selector: str) -> None:
             await asyncio.sleep(random.uniform(0.2, 0.6))
 
 
+_EMAIL_RE: "re.Pattern[str]" = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_WS_RE: "re.Pattern[str]" = re.compile(r"\s+")
+
+
 def extract_emails_from_text(text: str) -> Optional[List[str]]:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return _EMAIL_RE.findall(text)
 
 
 def refined_clean_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
 
 
 async def load_storage(storage_file: str) -> List[Any]:
     try:
-        with open(storage_file) as f:
-            storage = json.load(f)
-            return storage.get("cookies", [])
-    except (FileNotFoundError, json.JSONDecodeError):
-        logger.debug(f"Session file not found or invalid JSON: {storage_file}")
+        # Read in a worker thread so a slow disk never stalls the browser's event loop.
+        storage = json_loads(await asyncio.to_thread(_read_bytes, storage_file))
+        return storage.get("cookies", [])
+    except (FileNotFoundError, ValueError):
+        logger.debug("Session file not found or invalid JSON: %s", storage_file)
         return []
 
 
+def session_path(username: str) -> str:
+    return os.path.join(SESSION_STORE_DIR, f"linkedin_session_{username}.json")
+
+
+def session_is_fresh(username: str, config: Dict[str, Any]) -> bool:
+    """
+    Whether the saved session for `username` was written within sessions.max_age_hours
+    (default 6). ensure_logged_in trusts a fresh session without re-checking the feed, so
+    back-to-back runs skip the login round-trips.
+    """
+    max_age: float = config.get("sessions", {}).get("max_age_hours", 6) * 3600
+    try:
+        return time.time() - os.path.getmtime(session_path(username)) < max_age
+    except OSError:
+        return False
+
+
 async def load_session(page: Any, username: str) -> bool:
-    storage_file: str = os.path.join(SESSION_STORE_DIR, f"linkedin_session_{username}.json")
+    storage_file: str = session_path(username)
     storage = await load_storage(storage_file)
     if storage:
         await page.context.add_cookies(storage)
-        logger.debug(f"Session loaded from file for account: {username}")
+        logger.debug("Session loaded from file for account: %s", username)
         return True
     else:
-        logger.debug(f"No valid session found for account: {username}")
+        logger.debug("No valid session found for account: %s", username)
         return False
 
 
@@ -277,17 +365,30 @@ async def rotate_session(context: Any) -> bool:
         if storage:
             await context.add_cookies(storage)
             await context.storage_state(path=os.path.join(SESSION_STORE_DIR, selected_session))
-            logger.debug(f"Rotated session: {selected_session}")
+            logger.debug("Rotated session: %s", selected_session)
             return True
     return False
 
 
 async def ensure_logged_in(
-        page: Any, username: str, password: str, playwright: Any, config: Dict[str, Any]
+        page: Any,
+        username: str,
+        password: str,
+        playwright: Any,
+        config: Dict[str, Any],
+        session_seeded: bool = False
 ) -> Optional[Any]:
+    """
+    Return a logged-in page for `username`. Pass `session_seeded` when the page's context was
+    created from the account's storage_state file: its cookies are already in place, so only
+    the freshness check is left and the file is not read and re-added a second time.
+    """
     try:
         await apply_stealth_scripts(page)
-        session_loaded: bool = await load_session(page, username)
+        session_loaded: bool = session_seeded or await load_session(page, username)
+        if session_loaded and session_is_fresh(username, config):
+            logger.debug("Using fresh saved session for account: %s", username)
+            return page
         urls_conf: Dict[str, Any] = linked_config.get("urls", {})
         feed_url: str = urls_conf.get("feed_url", "https://www.linkedin.com/feed/")
         login_url: str = urls_conf.get("login_url", "https://www.linkedin.com/login")
@@ -296,10 +397,11 @@ async def ensure_logged_in(
             await page.goto(feed_url, wait_until=wait_until, timeout=750000)
             new_page: Optional[Any] = await wait_for_feed(page, playwright, config)
             if new_page:
-                logger.debug(f"Using saved session for account: {username}")
+                logger.debug("Using saved session for account: %s", username)
+                await new_page.context.storage_state(path=session_path(username))
                 return new_page
             else:
-                logger.debug(f"Session for {username} didn't load feed. Logging in fresh.")
+                logger.debug("Session for %s didn't load feed. Logging in fresh.", username)
         await page.goto(login_url, wait_until=wait_until)
         await simulate_human_behavior(page)
         username_input = await page.query_selector("input#username")
@@ -316,12 +418,11 @@ async def ensure_logged_in(
         await move_mouse_and_click(page, 'button[type="submit"]')
         new_page = await wait_for_feed(page, playwright, config)
         if not new_page:
-            logger.error(f"Login failed for account {username}. Unexpected URL: {page.url}")
+            logger.error("Login failed for account %s. Unexpected URL: %s", username, page.url)
             return None
-        logger.debug(f"Successfully logged in: {username}")
-        session_path: str = os.path.join(SESSION_STORE_DIR, f"linkedin_session_{username}.json")
-        await page.context.storage_state(path=session_path)
+        logger.debug("Successfully logged in: %s", username)
+        await new_page.context.storage_state(path=session_path(username))
         return new_page
     except Exception as e:
-        logger.error(f"Login failed for account {username}: {e}")
+        logger.error("Login failed for account %s: %s", username, e)
         return None
\ No newline at end of file
@@ -1,24 +1,189 @@
 import asyncio, random, re, time
-from datetime import datetime, timedelta
+from datetime import date
+from functools import lru_cache
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from jobfuq.logger.logger import logger
 from jobfuq.scraper.core.linked_utils import linked_config, simulate_human_behavior
-from jobfuq.utils.utils import load_config
 from tenacity import retry, stop_after_attempt, wait_exponential
 from typing import Any, Dict, List, Optional
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+")
+_EMPLOYEES_RE = re.compile(r"(\d{1,3}[Kk]?\+?)\s+employees?")
+_THOUSANDS_SEP_RE = re.compile(r"(\d+)[,](\d+)")
+_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+
+
+@lru_cache(maxsize=64)
+def _date_str(ordinal):
+    """Format a proleptic Gregorian day ordinal as YYYY-MM-DD; posting dates repeat a lot."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+# Reads every job card on the search page in one round-trip, applying the same selector
+# fallback chains the per-card lookups used. Applicant text candidates are returned in
+# lookup order (selectors, card-relative xpaths, whole card) for Python-side matching.
+# JobPosting JSON-LD embedded in the page, when present, fills fields the card lacks and
+# supplies the full description and posting date. The card snippet is returned alongside it,
+# since the title/description filter is tuned for snippets, not full posting text.
+EXTRACT_CARDS_JS = """
+(cfg) => {
+    let cards = [];
+    for (const sel of cfg.cardSelectors) {
+        try { cards = Array.from(document.querySelectorAll(sel)); } catch (e) { cards = []; }
+        if (cards.length) break;
+    }
+    const text = (el) => (el && el.textContent || '').trim();
+    const first = (card, sels) => {
+        for (const sel of sels) {
+            try { const el = card.querySelector(sel); if (el) return el; } catch (e) {}
+        }
+        return null;
+    };
+    const firstText = (card, sels) => {
+        for (const sel of sels) {
+            try { const t = text(card.querySelector(sel)); if (t) return t; } catch (e) {}
+        }
+        return '';
+    };
+    const relative = (xp) => xp.startsWith('(//') ? '(.' + xp.slice(1) : xp.startsWith('//') ? '.' + xp : xp;
+    // JobPosting objects embedded as JSON-LD, keyed by the numeric job id in their url.
+    const postings = {};
+    for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+        let data;
+        try { data = JSON.parse(script.textContent); } catch (e) { continue; }
+        for (const item of [].concat(data && data['@graph'] || data)) {
+            if (!item || item['@type'] !== 'JobPosting') continue;
+            const m = String(item.url || (item.identifier && item.identifier.value) || '').match(/\\d{6,}/);
+            if (m) postings[m[0]] = item;
+        }
+    }
+    const ldLocation = (ld) => {
+        const place = [].concat(ld.jobLocation || [])[0];
+        const addr = place && place.address || {};
+        return [addr.addressLocality, addr.addressRegion, addr.addressCountry].filter((v) => typeof v === 'string' && v).join(', ');
+    };
+    return cards.map((card) => {
+        let jobId = null;
+        for (const attr of cfg.jobIdAttrs) {
+            const v = card.getAttribute(attr);
+            if (v) { jobId = v; break; }
+        }
+        const applicantsTexts = [];
+        for (const sel of cfg.applicants) {
+            try { const el = card.querySelector(sel); if (el) applicantsTexts.push(text(el)); } catch (e) {}
+        }
+        for (const xp of cfg.applicantsXpaths) {
+            try {
+                const el = document.evaluate(relative(xp), card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                if (el) applicantsTexts.push(text(el));
+            } catch (e) {}
+        }
+        applicantsTexts.push(text(card));
+        const ld = postings[jobId] || {};
+        return {
+            jobId: jobId,
+            title: text(first(card, cfg.title)) || ld.title || '',
+            snippet: firstText(card, cfg.snippet),
+            ldDescription: typeof ld.description === 'string' ? ld.description : '',
+            company: firstText(card, cfg.company) || (ld.hiringOrganization && ld.hiringOrganization.name) || '',
+            location: firstText(card, cfg.location) || ldLocation(ld),
+            companySize: firstText(card, cfg.companySize),
+            datePosted: typeof ld.datePosted === 'string' ? ld.datePosted : '',
+            applicantsTexts: applicantsTexts,
+        };
+    });
+}
+"""
+
+# Number of rendered (non-empty) job cards under the first card selector that matches.
+# The search list is virtualized, so scrolling can fill in existing cards as well as add new ones.
+RENDERED_CARDS_JS = """
+(sels) => {
+    for (const sel of sels) {
+        let cards = [];
+        try { cards = Array.from(document.querySelectorAll(sel)); } catch (e) {}
+        if (cards.length) return cards.filter((c) => c.textContent.trim()).length;
+    }
+    return 0;
+}
+"""
+
+# Resolves once more cards are rendered than `n`.
+MORE_CARDS_JS = "(a) => (" + RENDERED_CARDS_JS.strip() + ")(a.sels) > a.n"
+
+# Job id of the first card under the first card selector that matches ('' if none).
+FIRST_CARD_ID_JS = """
+(cfg) => {
+    for (const sel of cfg.sels) {
+        let card = null;
+        try { card = document.querySelector(sel); } catch (e) {}
+        if (!card) continue;
+        for (const attr of cfg.attrs) {
+            const v = card.getAttribute(attr);
+            if (v) return v;
+        }
+        return '';
+    }
+    return '';
+}
+"""
+
+# Resolves once the first card differs from `old`, i.e. the next results page has rendered.
+CARDS_REPLACED_JS = "(a) => { const id = (" + FIRST_CARD_ID_JS.strip() + ")(a); return id !== '' && id !== a.old; }"
+
+# Reads everything get_job_details (and update_existing_job) needs in one round-trip: the
+# inline feedback message, the longest text per detail field, and applicant text candidates
+# in the order match_applicants_count tries them (selectors, xpaths, whole page).
+EXTRACT_DETAIL_JS = """
+(cfg) => {
+    const text = (el) => (el && el.textContent || '').trim();
+    const fields = {};
+    for (const [name, sels] of Object.entries(cfg.fields)) {
+        let best = '';
+        for (const sel of sels) {
+            try {
+                const t = text(document.querySelector(sel));
+                if (t.length > best.length) best = t;
+            } catch (e) {}
+        }
+        fields[name] = best;
+    }
+    const applicantsTexts = [];
+    for (const sel of cfg.applicants) {
+        try { const el = document.querySelector(sel); if (el) applicantsTexts.push(text(el)); } catch (e) {}
+    }
+    for (const xp of cfg.applicantsXpaths) {
+        try {
+            const el = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (el) applicantsTexts.push(text(el));
+        } catch (e) {}
+    }
+    applicantsTexts.push(document.body ? document.body.innerText : '');
+    return {
+        feedback: text(document.querySelector('.artdeco-inline-feedback__message')),
+        fields: fields,
+        applicantsTexts: applicantsTexts,
+    };
+}
+"""
+
+# Truthy once the detail page shows both its title and description (or an inline feedback
+# message, e.g. a closed job), so a single wait covers every field the record needs.
+DETAIL_READY_JS = (
+    "(cfg) => { const d = (" + EXTRACT_DETAIL_JS.strip() + ")(cfg); "
+    "return !!(d.feedback || (d.fields.title && d.fields.description)); }"
+)
+
 class LinkedInScraper:
     def __init__(self, config, time_filter, blacklist_data, playwright=None):
         self.config = config
         self.time_filter = time_filter
         self.blacklist_data = blacklist_data
         self.playwright = playwright
-        try:
-            self.scraper_config = load_config('jobfuq/conf/linked_config.toml')
-            logger.info('Loaded scraper config from linked_config.toml')
-        except Exception as e:
-            logger.error(f"Failed to load scraper config: {e}")
-            self.scraper_config = {}
+        # Parsed once at import by linked_utils and shared by every scraper instance.
+        self.scraper_config = linked_config
 
         urls_conf = self.scraper_config.get('urls', {})
         timeouts_conf = self.scraper_config.get('timeouts', {})
@@ -28,6 +193,12 @@ class LinkedInScraper:
         self.wait_until = urls_conf.get('wait_until', 'domcontentloaded')
         self.selector_timeout = timeouts_conf.get('selector_timeout', 930000)
         self.text_timeout = timeouts_conf.get('get_text_timeout', 25000)
+        self.scroll_timeout = timeouts_conf.get('scroll_timeout', 4000)
+
+        self.applicant_patterns = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in self.scraper_config.get('applicants_update', {}).get('patterns', [])
+        ]
 
         self.job_id_attrs = attrs_conf.get('job_id', ['data-occludable-job-id', 'data-job-id', 'data-id'])
         self.scraping_mode = config.get('scraping', {}).get('mode', 'normal').lower()
@@ -35,7 +206,51 @@ class LinkedInScraper:
             logger.info('Aggressive mode active: reducing text timeout')
             self.text_timeout = 1000
 
+        # Search URL templates, selector lists and page-script arguments are fixed for the
+        # scraper's lifetime, so they are built once here rather than on every scroll or job.
+        jobs_conf = self.scraper_config.get('jobs', {})
+        card_conf = self.scraper_config.get('card', {})
+        detail_conf = self.scraper_config.get('detail', {})
+        au_conf = self.scraper_config.get('applicants_update', {})
+        self.search_url_pattern = urls_conf.get(
+            'search_url_pattern',
+            '/jobs/search/?keywords={keywords}&location={location}&f_TPR={time_filter}'
+        )
+        self.remote_search_url_pattern = self.search_url_pattern + "&f_WT={remote}"
+        self.job_list_selectors = jobs_conf.get('job_list_selectors', [])
+        self.card_selectors = jobs_conf.get('job_card_selectors', [])
+        self.pagination_selectors = self.scraper_config.get('pagination', {}).get('selectors', [])
+        self.closed_app_text = au_conf.get('closed_application_text', 'no longer accepting applications').lower()
+        self.cards_cfg = {
+            'cardSelectors': self.card_selectors,
+            'jobIdAttrs': self.job_id_attrs,
+            'title': card_conf.get('title_selectors', []),
+            'company': card_conf.get('company_selectors', []),
+            'location': card_conf.get('location_selectors', []),
+            'snippet': card_conf.get('snippet_selectors', []),
+            'companySize': card_conf.get('company_size_selectors', []),
+            'applicants': au_conf.get('selectors', []),
+            'applicantsXpaths': au_conf.get('xpaths', []),
+        }
+        self.detail_cfg = {
+            'fields': {
+                'title': detail_conf.get('title_selectors', []),
+                'company': detail_conf.get('company_selectors', []),
+                'location': detail_conf.get('location_selectors', []),
+                'description': detail_conf.get('description_selectors', []),
+                'companySize': detail_conf.get('company_size_selectors', []),
+                'postedTime': detail_conf.get('posted_time_selectors', []),
+            },
+            'applicants': au_conf.get('selectors', []),
+            'applicantsXpaths': au_conf.get('xpaths', []),
+        }
+        # Status rechecks only need the feedback message and applicant texts.
+        self.status_cfg = {**self.detail_cfg, 'fields': {}}
+
         self.company_size_cache = {}
+        # 'always' loads every detail page, 'when_missing' skips it when the search card is
+        # already complete (see store_card_data), 'never' builds job data from the card alone.
+        self.fetch_details = config.get('fetch_details', 'when_missing').lower()
 
         # Setup local retry settings
         self.smart_retry_enabled = config.get('smart_retry_enabled', False)
@@ -48,29 +263,24 @@ class LinkedInScraper:
         attempts = self.smart_retry_attempts if self.smart_retry_enabled else 1
         for i in range(attempts):
             try:
-                logger.info(f"Navigating to: {url} (attempt {i+1})")
+                logger.info("Navigating to: %s (attempt %s)", url, i+1)
                 await page.goto(url, wait_until=self.wait_until, timeout=self.selector_timeout)
                 return True
             except PlaywrightTimeoutError as e:
-                logger.warning(f"Timeout navigating to {url} (attempt {i+1} of {attempts}): {e}")
+                logger.warning("Timeout navigating to %s (attempt %s of %s): %s", url, i+1, attempts, e)
                 if i < attempts - 1:
                     sleep_dur = random.uniform(self.smart_retry_sleep_min, self.smart_retry_sleep_max)
-                    logger.info(f"Retrying after {sleep_dur:.2f}s...")
+                    logger.info("Retrying after %.2fs...", sleep_dur)
                     await asyncio.sleep(sleep_dur)
                 else:
-                    logger.error(f"Exhausted retries for {url}")
+                    logger.error("Exhausted retries for %s", url)
                     return False
             except Exception as ex:
-                logger.error(f"Error navigating to {url}: {ex}")
+                logger.error("Error navigating to %s: %s", url, ex)
                 return False
 
     async def search_jobs(self, page, keywords, location, remote=None):
-        sp = self.scraper_config.get('urls', {}).get(
-            'search_url_pattern',
-            '/jobs/search/?keywords={keywords}&location={location}&f_TPR={time_filter}'
-        )
-        if remote is not None:
-            sp += "&f_WT={remote}"
+        sp = self.search_url_pattern if remote is None else self.remote_search_url_pattern
         search_url = self.base_url + sp.format(
             keywords=keywords,
             location=location,
@@ -78,38 +288,43 @@ class LinkedInScraper:
             remote=remote
         )
         if not await self.robust_goto(page, search_url):
-            logger.error(f"search_jobs failed to load {search_url}")
+            logger.error("search_jobs failed to load %s", search_url)
             return []
         # If a captcha/checkpoint appears, handle it via linked_utils
         from jobfuq.scraper.core.linked_utils import handle_manual_captcha
         if "checkpoint/challenge" in page.url:
             await handle_manual_captcha(page, self.playwright, self.config)
-        logger.info(f"Landed on: {page.url}")
+        logger.info("Landed on: %s", page.url)
         from jobfuq.scraper.core.linked_utils import simulate_human_behavior
         await simulate_human_behavior(page)
-        for sel in self.scraper_config.get('jobs', {}).get('job_list_selectors', []):
+        for sel in self.job_list_selectors:
             try:
                 await page.wait_for_selector(sel, timeout=self.selector_timeout)
-                logger.info(f"Job list found: {sel}")
+                logger.info("Job list found: %s", sel)
                 break
             except PlaywrightTimeoutError:
-                logger.debug(f"No job list with {sel}")
+                logger.debug("No job list with %s", sel)
         job_infos = []
+        seen_ids = set()
         page_num = 1
         max_postings = self.config.get('max_postings', 100)
         while len(job_infos) < max_postings:
-            logger.info(f"Current page: {page.url}")
-            job_infos.extend(await self.extract_job_infos(page))
-            job_infos = list({x['job_id']: x for x in job_infos}.values())
-            logger.info(f"Total jobs so far: {len(job_infos)}")
+            logger.info("Current page: %s", page.url)
+            for info in await self.extract_job_infos(page):
+                if info['job_id'] not in seen_ids:
+                    seen_ids.add(info['job_id'])
+                    job_infos.append(info)
+            logger.info("Total jobs so far: %s", len(job_infos))
             if len(job_infos) >= max_postings:
                 break
-            old_count = len(job_infos)
+            rendered = await page.evaluate(RENDERED_CARDS_JS, self.card_selectors)
             await page.evaluate('window.scrollBy(0, 5000)')
-            await asyncio.sleep(random.uniform(2, 3))
-            job_infos.extend(await self.extract_job_infos(page))
-            job_infos = list({x['job_id']: x for x in job_infos}.values())
-            if len(job_infos) == old_count:
+            try:
+                # Extract again as soon as the scroll renders more cards, not after a fixed sleep.
+                await page.wait_for_function(
+                    MORE_CARDS_JS, arg={'sels': self.card_selectors, 'n': rendered}, timeout=self.scroll_timeout
+                )
+            except PlaywrightTimeoutError:
                 logger.info('No new postings; attempting pagination.')
                 old_url = page.url
                 if not await self.go_to_next_page(page, page_num):
@@ -122,8 +337,8 @@ class LinkedInScraper:
 
     async def go_to_next_page(self, page, current_page):
         next_num = current_page + 1
-        logger.info(f"Next page: {next_num}")
-        for sel in self.scraper_config.get('pagination', {}).get('selectors', []):
+        logger.info("Next page: %s", next_num)
+        for sel in self.pagination_selectors:
             try:
                 try:
                     formatted_sel = sel.format(page=next_num)
@@ -133,196 +348,157 @@ class LinkedInScraper:
                 if btn:
                     disabled = await btn.get_attribute('disabled') or await btn.get_attribute('aria-disabled')
                     if disabled and disabled.lower() in ['true', 'disabled']:
-                        logger.info(f"Button '{formatted_sel}' disabled.")
+                        logger.info("Button '%s' disabled.", formatted_sel)
                         continue
-                    logger.info(f"Clicking pagination: '{formatted_sel}'")
+                    logger.info("Clicking pagination: '%s'", formatted_sel)
+                    first_card = {'sels': self.card_selectors, 'attrs': self.job_id_attrs}
+                    first_card['old'] = await page.evaluate(FIRST_CARD_ID_JS, first_card)
                     await btn.click()
                     await page.wait_for_load_state(self.wait_until)
-                    await asyncio.sleep(2)
+                    try:
+                        # Results are swapped in place; wait for the new first card, not a fixed 2s.
+                        await page.wait_for_function(CARDS_REPLACED_JS, arg=first_card, timeout=self.scroll_timeout)
+                    except PlaywrightTimeoutError:
+                        logger.debug("Page %s cards did not change within %s ms.", next_num, self.scroll_timeout)
                     return True
             except Exception as e:
-                logger.debug(f"Error with pagination '{formatted_sel}': {e}")
-        logger.info(f"No valid pagination for page {next_num}.")
+                logger.debug("Error with pagination '%s': %s", formatted_sel, e)
+        logger.info("No valid pagination for page %s.", next_num)
         return False
 
     async def extract_job_infos(self, page):
         results = []
         logger.info('Extracting job cards...')
-        card_selectors = self.scraper_config.get('jobs', {}).get('job_card_selectors', [])
-        job_cards = []
-        for sel in card_selectors:
-            try:
-                found = await page.query_selector_all(sel)
-                if found:
-                    job_cards = found
-                    logger.info(f"Found {len(found)} cards using: {sel}")
-                    break
-            except Exception as ex:
-                logger.debug(f"Error with {sel}: {ex}")
-        if not job_cards:
+        try:
+            cards = await page.evaluate(EXTRACT_CARDS_JS, self.cards_cfg)
+        except Exception as ex:
+            logger.debug("Error extracting job cards: %s", ex)
+            return results
+        if not cards:
             logger.debug('No job cards found.')
             return results
-        card_conf = self.scraper_config.get('card', {})
-        title_selectors = card_conf.get('title_selectors', [])
-        company_selectors = card_conf.get('company_selectors', [])
-        location_selectors = card_conf.get('location_selectors', [])
-        snippet_selectors = card_conf.get('snippet_selectors', [])
-        company_size_selectors = card_conf.get('company_size_selectors', [])
-        for card in job_cards:
-            title_elem = None
-            for sel in title_selectors:
-                title_elem = await card.query_selector(sel)
-                if title_elem:
-                    break
-            title = (await title_elem.text_content()).strip() if title_elem else ''
-            descr = ""
-            for sel in snippet_selectors:
-                elem = await card.query_selector(sel)
-                if elem:
-                    descr = (await elem.text_content()).strip()
-                    if descr:
-                        break
-            from jobfuq.scraper.core.filter import passes_filter
-            if not passes_filter(title, descr):
-                logger.info(f"Job filtered out by whitelist rules: '{title}'")
+        logger.info("Found %s cards.", len(cards))
+        from jobfuq.scraper.core.filter import passes_filter
+        for card in cards:
+            title = card['title']
+            snippet = self.clean_html(card['snippet'])
+            if not passes_filter(title, snippet):
+                logger.info("Job filtered out by whitelist rules: '%s'", title)
                 continue
-            job_id = await self.extract_job_id(card)
+            job_id = card['jobId']
             if not job_id:
-                logger.warning(f"Missing job ID for: '{title}'")
+                logger.warning("Missing job ID for: '%s'", title)
                 continue
-            company = ''
-            for sel in company_selectors:
-                elem = await card.query_selector(sel)
-                if elem:
-                    company = (await elem.text_content()).strip()
-                    if company:
-                        break
-            loc = ''
-            for sel in location_selectors:
-                elem = await card.query_selector(sel)
-                if elem:
-                    loc = (await elem.text_content()).strip()
-                    if loc:
-                        break
-            applicants_count = await self.extract_applicants_count(card)
-            csize = None
-            for sel in company_size_selectors:
-                elem = await card.query_selector(sel)
-                if elem:
-                    txt = await elem.text_content()
-                    if txt:
-                        csize = txt.strip()
-                        break
-            results.append({
+            # The full JSON-LD description is only stored, never filtered on.
+            ld_descr = self.clean_html(card['ldDescription'])
+            descr = ld_descr if len(ld_descr) > len(snippet) else snippet
+            info = {
                 'job_id': job_id,
                 'title': title,
-                'company': company,
-                'location': loc,
+                'company': card['company'],
+                'location': card['location'],
                 'description': descr,
-                'applicants_count': applicants_count,
-                'company_size': csize or 'Unknown'
-            })
-        logger.info(f"Extracted {len(results)} job cards.")
+                'applicants_count': self.match_applicants_count(card['applicantsTexts']),
+                'company_size': card['companySize'] or 'Unknown'
+            }
+            if card['datePosted']:
+                info['date'] = card['datePosted'][:10]
+            results.append(info)
+        logger.info("Extracted %s job cards.", len(results))
         return results
 
-    async def extract_job_id(self, card):
-        for attr in self.job_id_attrs:
-            val = await card.get_attribute(attr)
-            if val:
-                return val
+    def store_card_data(self, info):
+        """
+        Prepare a search card for insertion. A card stored with every field the detail page
+        gives (including the applicants count) is never selected by get_incomplete_jobs, so
+        under 'always' the count is dropped to force a detail page visit.
+        """
+        if self.fetch_details == 'always':
+            info['applicants_count'] = None
+        return info
 
-    async def extract_applicants_count(self, card):
-        return await self.fetch_applicants_count(card)
-
-    async def fetch_applicants_count(self, context_obj):
-        au_conf = self.scraper_config.get('applicants_update', {})
-        selectors = au_conf.get('selectors', [])
-        xpaths = au_conf.get('xpaths', [])
-        patterns = au_conf.get('patterns', [])
-        for sel in selectors:
-            try:
-                elem = await context_obj.query_selector(sel)
-                if elem:
-                    text = (await elem.text_content() or '').strip()
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
-                        if match:
-                            return int(match.group(1))
-            except Exception:
-                continue
-        for xpath in xpaths:
-            try:
-                elem = await context_obj.query_selector(f"xpath={xpath}")
-                if elem:
-                    text = (await elem.text_content() or '').strip()
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
-                        if match:
-                            return int(match.group(1))
-            except Exception:
-                continue
-        try:
-            full_text = (await context_obj.text_content() or '').strip()
-            for pattern in patterns:
-                match = re.search(pattern, full_text, re.IGNORECASE)
+    def match_applicants_count(self, texts):
+        """Return the first applicants count the configured patterns find in `texts`, tried in order."""
+        for text in texts:
+            for pattern in self.applicant_patterns:
+                match = pattern.search(text)
                 if match:
                     return int(match.group(1))
-        except Exception:
-            pass
-        try:
-            page = getattr(context_obj, 'page', None) or context_obj
-            full_page_text = await page.evaluate('document.body.innerText')
-            for pattern in patterns:
-                match = re.search(pattern, full_page_text, re.IGNORECASE)
-                if match:
-                    return int(match.group(1))
-        except Exception:
-            pass
-        logger.warning('❌ No applicants count found.')
         return None
 
-    async def get_job_details(self, page, job_id, conn=None, **kwargs):
+    async def get_job_details(self, page, job_id, status_writer=None, search_card_info=None, **kwargs):
         jurl = f"{self.base_url}/jobs/view/{job_id}/"
-        logger.info(f"Job detail: {jurl}")
+        if self.fetch_details == 'never':
+            if not search_card_info:
+                logger.info("Skipping detail page (fetch_details = 'never'): %s", jurl)
+                return
+            # Card data only: build the record from what the search card had.
+            logger.info("Job detail from search card: %s", jurl)
+            card = search_card_info
+            return self.build_job_data(
+                job_id, jurl, card.get('title') or '', card.get('company') or '', card.get('location') or '',
+                card.get('description') or '', card.get('company_size') or 'Unknown',
+                card.get('applicants_count'), card.get('company_url') or '',
+                posted_date=card.get('date'), listed_at=card.get('listed_at')
+            )
+        logger.info("Job detail: %s", jurl)
         loaded = await self.robust_goto(page, jurl)
         if not loaded:
-            logger.error(f"get_job_details: couldn't load {jurl}")
+            logger.error("get_job_details: couldn't load %s", jurl)
             return
         from jobfuq.scraper.core.linked_utils import simulate_human_behavior
         await simulate_human_behavior(page)
-        closed_app_text = self.scraper_config.get('applicants_update', {}).get(
-            'closed_application_text', 'no longer accepting applications'
-        ).lower()
-        feedback_elem = await page.query_selector('.artdeco-inline-feedback__message')
-        if feedback_elem:
-            feedback_text = (await feedback_elem.text_content() or '').strip().lower()
-            if closed_app_text in feedback_text:
-                logger.info(f"Job {job_id} is closed (no longer accepting applications).")
-                if conn:
-                    current_time = int(time.time() * 1000)
-                    conn.execute(
-                        'UPDATE job_listings SET applicants_count = ?, last_checked = ?, application_status = ?, job_state = ? WHERE job_url = ?',
-                        (999, current_time, 'closed', 'CLOSED', jurl)
-                    )
-                    conn.commit()
-                return
-        detail_conf = self.scraper_config.get('detail', {})
-        title_selectors = detail_conf.get('title_selectors', [])
-        company_selectors = detail_conf.get('company_selectors', [])
-        location_selectors = detail_conf.get('location_selectors', [])
-        description_selectors = detail_conf.get('description_selectors', [])
-        company_size_selectors = detail_conf.get('company_size_selectors', [])
-        title = await self.get_field_content(page, title_selectors, default='')
-        company = await self.get_field_content(page, company_selectors, default='')
-        loc = await self.get_field_content(page, location_selectors, default='')
-        descr = await self.get_field_content(page, description_selectors, default='')
-        applicants_count = await self.fetch_applicants_count(page)
-        company_size = await self.get_field_content(page, company_size_selectors, default='Unknown')
-        job_data = {
+        cfg = self.detail_cfg
+        try:
+            detail = await page.evaluate(EXTRACT_DETAIL_JS, cfg)
+            fields = detail['fields']
+            if not detail['feedback'] and not (fields['title'] and fields['description']):
+                # Top card or description not rendered yet: wait once for both, then read
+                # everything again.
+                try:
+                    await page.wait_for_function(DETAIL_READY_JS, arg=cfg, timeout=self.text_timeout)
+                except PlaywrightTimeoutError:
+                    logger.debug("get_job_details: detail fields still incomplete for %s", jurl)
+                detail = await page.evaluate(EXTRACT_DETAIL_JS, cfg)
+        except Exception as ex:
+            logger.error("get_job_details: couldn't read %s: %s", jurl, ex)
+            return
+        if self.closed_app_text in detail['feedback'].lower():
+            logger.info("Job %s is closed (no longer accepting applications).", job_id)
+            if status_writer:
+                status_writer.put(self.closed_status(jurl))
+            return
+        fields = detail['fields']
+        title = fields['title']
+        company = fields['company']
+        loc = fields['location']
+        descr = fields['description']
+        applicants_count = self.match_applicants_count(detail['applicantsTexts'])
+        if applicants_count is None:
+            logger.warning('❌ No applicants count found.')
+        company_size = fields['companySize'] or 'Unknown'
+        # Only a posted time shown on the page replaces the stored posting date.
+        posted_date = self.parse_posting_date(fields['postedTime']) if fields['postedTime'] else None
+        job_data = self.build_job_data(
+            job_id, jurl, title, company, loc, descr, company_size, applicants_count, posted_date=posted_date
+        )
+        logger.info("Extracted details: %s @ %s", job_data['title'], job_data['company'])
+        return job_data
+
+    def build_job_data(
+            self, job_id, jurl, title, company, loc, descr, company_size, applicants_count, company_url='',
+            posted_date=None, listed_at=None
+    ):
+        """
+        Build a job_listings row from scraped fields. `posted_date` and `listed_at` stay None
+        when the source did not supply them, so update_job_details keeps the stored values
+        (e.g. the JSON-LD datePosted recorded at search time).
+        """
+        return {
             'job_id': job_id,
             'title': title.strip(),
             'company': company.strip(),
-            'company_url': '',
+            'company_url': company_url,
             'location': loc.strip(),
             'description': self.clean_html(descr.strip()),
             'remote_allowed': False,
@@ -330,106 +506,76 @@ class LinkedInScraper:
             'company_size': company_size,
             'company_size_score': 0,
             'job_url': jurl,
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'listed_at': int(time.time() * 1000),
+            'date': posted_date,
+            'listed_at': listed_at,
             'applicants_count': applicants_count,
             'overall_relevance': 0.0,
             'is_posted': 1,
             'application_status': 'not applied'
         }
-        logger.info(f"Extracted details: {job_data['title']} @ {job_data['company']}")
-        return job_data
-
-    async def get_field_content(self, page, selectors, default=''):
-        desc_text = ''
-        for sel in selectors:
-            content = await self.get_text_content(page, sel, default='')
-            if content and len(content) > len(desc_text):
-                desc_text = content
-        return desc_text if desc_text else default
-
-    async def get_text_content(self, page, selector, default=''):
-        try:
-            el = await page.wait_for_selector(selector, timeout=self.text_timeout)
-            if el:
-                txt = await el.text_content()
-                if txt:
-                    return txt.strip()
-        except PlaywrightTimeoutError:
-            pass
-        except Exception as e:
-            logger.debug(f"get_text_content error: {e}")
-        return default
 
     def parse_posting_date(self, posted_time):
+        today = date.today().toordinal()
         if not posted_time:
-            return datetime.now().strftime('%Y-%m-%d')
+            return _date_str(today)
         pt = posted_time.lower()
         try:
             if 'minute' in pt or 'hour' in pt or 'just now' in pt:
-                return datetime.now().strftime('%Y-%m-%d')
+                return _date_str(today)
             if 'yesterday' in pt:
-                return (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+                return _date_str(today - 1)
+            num = _DIGITS_RE.search(pt)
             if 'day' in pt:
-                days = int(re.search('(\\d+)', pt).group())
-                return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+                return _date_str(today - int(num.group()))
             if 'week' in pt:
-                weeks = int(re.search('(\\d+)', pt).group())
-                return (datetime.now() - timedelta(weeks=weeks)).strftime('%Y-%m-%d')
+                return _date_str(today - 7 * int(num.group()))
         except Exception as e:
-            logger.error(f"Error parsing date: {e}")
-        return datetime.now().strftime('%Y-%m-%d')
+            logger.error("Error parsing date: %s", e)
+        return _date_str(today)
 
     def clean_html(self, txt):
         if not txt:
             return ''
-        return re.sub('\\s+', ' ', re.sub('<[^>]+>', '', txt)).strip()
+        return _WS_RE.sub(' ', _TAG_RE.sub('', txt)).strip()
+
+    def closed_status(self, job_url):
+        return {
+            'job_url': job_url,
+            'applicants_count': 999,
+            'job_state': 'CLOSED',
+            'application_status': 'closed',
+            'last_checked': int(time.time() * 1000)
+        }
 
-    async def update_existing_job(self, conn, job_url, page):
+    async def update_existing_job(self, job_url, page):
+        """
+        Recheck a stored job's page and return its new status row, or None on failure. The
+        row is not written here; callers batch them into bulk_update_job_status.
+        """
         try:
-            logger.info(f"Updating job: {job_url}")
+            logger.info("Updating job: %s", job_url)
             loaded = await self.robust_goto(page, job_url)
             if not loaded:
-                logger.error(f"update_existing_job: couldn't load {job_url}")
+                logger.error("update_existing_job: couldn't load %s", job_url)
                 return
             from jobfuq.scraper.core.linked_utils import simulate_human_behavior
             await simulate_human_behavior(page)
-            closed_app_text = self.scraper_config.get('applicants_update', {}).get(
-                'closed_application_text', 'no longer accepting applications'
-            ).lower()
-            feedback_elem = await page.query_selector('.artdeco-inline-feedback__message')
-            if feedback_elem:
-                feedback_text = (await feedback_elem.text_content() or '').strip().lower()
-                if closed_app_text in feedback_text:
-                    logger.info(f"Job {job_url} is closed. Marking in DB as CLOSED.")
-                    current_time = int(time.time() * 1000)
-                    conn.execute(
-                        'UPDATE job_listings SET applicants_count = ?, last_checked = ?, application_status = ?, job_state = ? WHERE job_url = ?',
-                        (999, current_time, 'closed', 'CLOSED', job_url)
-                    )
-                    conn.commit()
-                    return {
-                        'job_url': job_url,
-                        'applicants_count': 999,
-                        'job_state': 'CLOSED',
-                        'last_checked': current_time
-                    }
-            applicants_count = await self.fetch_applicants_count(page)
-            current_time = int(time.time() * 1000)
-            conn.execute(
-                'UPDATE job_listings SET applicants_count = ?, last_checked = ?, job_state = ? WHERE job_url = ?',
-                (applicants_count, current_time, 'ACTIVE', job_url)
-            )
-            conn.commit()
-            logger.info(f"Updated {job_url}: count={applicants_count}, state=ACTIVE")
+            status = await page.evaluate(EXTRACT_DETAIL_JS, self.status_cfg)
+            if self.closed_app_text in status['feedback'].lower():
+                logger.info("Job %s is closed. Marking in DB as CLOSED.", job_url)
+                return self.closed_status(job_url)
+            applicants_count = self.match_applicants_count(status['applicantsTexts'])
+            if applicants_count is None:
+                logger.warning('❌ No applicants count found.')
+            logger.info("Updated %s: count=%s, state=ACTIVE", job_url, applicants_count)
             return {
                 'job_url': job_url,
                 'applicants_count': applicants_count,
                 'job_state': 'ACTIVE',
-                'last_checked': current_time
+                'last_checked': int(time.time() * 1000)
             }
         except Exception as e:
-            logger.error(f"Error updating {job_url}: {e}")
+            logger.error("Error updating %s: %s", job_url, e)
             return
 
 
@@ -441,13 +587,12 @@ async def get_company_size(page: Any, url: str) -> str:
             wait_until=linked_config.get("urls", {}).get("wait_until", "domcontentloaded"),
             timeout=730000,
         )
-        await page.wait_for_load_state("domcontentloaded")
         await simulate_human_behavior(page)
         not_found_selector: str = linked_config.get("company", {}).get(
             "not_found_selector", 'h1:has-text("Page not found")'
         )
         if await page.query_selector(not_found_selector):
-            logger.warning(f"Company page not found: {url}")
+            logger.warning("Company page not found: %s", url)
             return "Unknown"
         size_selectors: List[str] = linked_config.get("company", {}).get(
             "size_selectors",
@@ -466,20 +611,20 @@ async def get_company_size(page: Any, url: str) -> str:
         summary_element = await page.query_selector(summary_selector)
         if summary_element:
             summary_text: str = (await summary_element.inner_text()).strip()
-            size_match = re.search(r"(\d{1,3}[Kk]?\+?)\s+employees?", summary_text)
+            size_match = _EMPLOYEES_RE.search(summary_text)
             if size_match:
                 return parse_company_size(size_match.group(1))
-        logger.warning(f"Employee count not found on page: {url}")
+        logger.warning("Employee count not found on page: %s", url)
         return "Unknown"
     except Exception as e:
-        logger.error(f"Error scraping company size from {url}: {str(e)}")
+        logger.error("Error scraping company size from %s: %s", url, e)
         return "Unknown"
 
 
 def parse_company_size(size_text: str) -> str:
     size_text = size_text.lower().strip()
-    size_text = re.sub(r"(\d+)[,](\d+)", r"\1\2", size_text)
-    size_text = re.sub(r"(\d+)\s*-\s*(\d+)", r"\1-\2", size_text)
+    size_text = _THOUSANDS_SEP_RE.sub(r"\1\2", size_text)
+    size_text = _RANGE_RE.sub(r"\1-\2", size_text)
     size_text = size_text.replace("k", "000").replace("K", "000").replace("+", "+")
     return size_text
 
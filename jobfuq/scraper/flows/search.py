@@ -1,15 +1,15 @@
 import asyncio, random, re, time
-from playwright.async_api import async_playwright
 from jobfuq.logger.logger import logger, set_verbose
-from jobfuq.utils.utils import load_config
+from jobfuq.utils.utils import load_config, run_async
 from jobfuq.database.database import (
     create_connection, create_table, create_blacklist_table,
-    create_blacklisted_companies_table, load_blacklist, job_exists, insert_job_minimal
+    create_blacklisted_companies_table, EMPTY_BLACKLIST, load_blacklist, load_job_urls, bulk_insert_jobs_minimal
 )
 from jobfuq.scraper.core.scraper import LinkedInScraper
-from jobfuq.scraper.core.linked_utils import block_resources, ensure_logged_in, simulate_human_behavior
+from jobfuq.scraper.core.browser_manager import BrowserManager
+from jobfuq.scraper.core.linked_utils import simulate_human_behavior
 
-async def main(config):
+async def main(config, manager=None):
     set_verbose(config.get('verbose', False))
     conn = create_connection(config)
     create_table(conn)
@@ -18,70 +18,97 @@ async def main(config):
     try:
         blacklist = load_blacklist(conn)
     except Exception as e:
-        logger.error(f"Error loading blacklist: {e}")
-        blacklist = {'blacklist': set(), 'whitelist': set()}
+        logger.error("Error loading blacklist: %s", e)
+        blacklist = EMPTY_BLACKLIST
+    # Known job URLs, loaded once and kept current as jobs are inserted.
+    seen_urls = load_job_urls(conn)
 
-    async with async_playwright() as p:
-        headless = config.get("headless", False)
-        browser = await p.chromium.launch(headless=headless, slow_mo=50)
-        context = await browser.new_context(
-            viewport={'width': 1280 + random.randint(-50, 50), 'height': 720 + random.randint(-30, 30)},
-            user_agent=random.choice(config.get('user_agents', ['Mozilla/5.0']))
-        )
-        await context.route("**/*", block_resources)
-        page = await context.new_page()
+    creds_list = list(config.get('linkedin_credentials', {}).values())
+    if not creds_list:
+        logger.error("No LinkedIn credentials provided in config!")
+        conn.close()
+        return
 
-        # Perform login explicitly using ensure_logged_in.
-        creds_pool = config.get('linkedin_credentials', {}).values()
-        if not creds_pool:
-            logger.error("No LinkedIn credentials provided in config!")
-            await browser.close()
-            conn.close()
-            return
-        creds = random.choice(list(creds_pool))
-        username, password = creds['username'], creds['password']
-        logger.info(f"Logging in with: {username}")
-        logged_in_page = await ensure_logged_in(page, username, password, p, config)
-        if not logged_in_page:
-            logger.error("Login failed. Aborting search flow.")
-            await browser.close()
-            conn.close()
-            return
-        page = logged_in_page  # Use the page returned after successful login
+    search_queries = config.get("search_queries", [{"keywords": "DevOps", "location": "Remote", "remote": None}])
+    if not search_queries:
+        logger.error("No search queries configured!")
+        conn.close()
+        return
+    queue = asyncio.Queue()
+    for query in search_queries:
+        queue.put_nowait(query)
+    # Each worker uses one account's logged-in context and pulls queries until none are left.
+    workers = max(1, min(config.get("max_parallel_queries", 1), len(search_queries)))
+    # Credentials are handed out round-robin from a random starting point.
+    first_cred = random.randrange(len(creds_list))
 
+    # A manager passed in by the orchestrator outlives this flow; otherwise it is ours to shut down.
+    own_manager = manager is None
+    if own_manager:
+        manager = BrowserManager(config)
+    try:
+        await manager.initialize()
         time_filter = config.get("time_filter", "r604800")
-        scraper = LinkedInScraper(config, time_filter, blacklist, playwright=p)
-        search_queries = config.get("search_queries", [{"keywords": "DevOps", "location": "Remote", "remote": None}])
-        for query in search_queries:
-            keywords = query.get("keywords")
-            location = query.get("location")
-            remote = query.get("remote")
-            logger.info(f"Searching jobs with keywords={keywords}, location={location}, remote={remote}")
-            # Gather job cards from the search results page.
-            job_infos = await scraper.search_jobs(page, keywords, location, remote)
-            logger.info(f"Found {len(job_infos)} job listings")
-            for info in job_infos:
-                job_url = f"{scraper.base_url}/jobs/view/{info['job_id']}/"
-                if job_exists(conn, job_url):
-                    logger.debug(f"Job {job_url} already exists; skipping.")
-                    continue
-                # Ensure that company_url key is present.
-                if "company_url" not in info:
-                    info["company_url"] = ""
-                # If search results already provide title and company, use them.
-                # Additional details will be updated later via the details flow.
-                info["job_url"] = job_url
-                if "title" not in info or not info["title"]:
-                    info["title"] = "No Title"
-                if "company" not in info or not info["company"]:
-                    info["company"] = "No Company"
-                insert_job_minimal(conn, info)
-                conn.commit()
-                logger.info(f"Inserted job from search: {info['title']} @ {info['company']}")
-        await browser.close()
-    conn.close()
+        scraper = LinkedInScraper(config, time_filter, blacklist, playwright=manager.playwright)
+        results = await asyncio.gather(*(
+            search_worker(manager, creds_list[(first_cred + i) % len(creds_list)], scraper, conn, queue, seen_urls)
+            for i in range(workers)
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Search worker failed: %s", result)
+        if not queue.empty():
+            logger.error("%s search queries left unprocessed (login failed).", queue.qsize())
+    finally:
+        if own_manager:
+            await manager.shutdown()
+        conn.close()
+
+async def search_worker(manager, creds, scraper, conn, queue, seen_urls):
+    async with manager.acquire(creds) as page:
+        if not page:
+            logger.error("Login failed for %s. Aborting this search worker.", creds['username'])
+            return
+        while not queue.empty():
+            query = queue.get_nowait()
+            try:
+                await run_search_query(scraper, page, conn, query, seen_urls)
+            except Exception as e:
+                # One failed query must not take the worker's remaining queries down with it.
+                logger.error("Search query %s @ %s failed: %s", query.get('keywords'), query.get('location'), e)
+
+async def run_search_query(scraper, page, conn, query, seen_urls):
+    keywords = query.get("keywords")
+    location = query.get("location")
+    remote = query.get("remote")
+    logger.info("Searching jobs with keywords=%s, location=%s, remote=%s", keywords, location, remote)
+    # Gather job cards from the search results page.
+    job_infos = await scraper.search_jobs(page, keywords, location, remote)
+    logger.info("Found %s job listings", len(job_infos))
+    new_jobs = []
+    for info in job_infos:
+        job_url = f"{scraper.base_url}/jobs/view/{info['job_id']}/"
+        if job_url in seen_urls:
+            logger.debug("Job %s already exists; skipping.", job_url)
+            continue
+        # Ensure that company_url key is present.
+        if "company_url" not in info:
+            info["company_url"] = ""
+        # If search results already provide title and company, use them.
+        # Additional details will be updated later via the details flow.
+        info["job_url"] = job_url
+        if "title" not in info or not info["title"]:
+            info["title"] = "No Title"
+        if "company" not in info or not info["company"]:
+            info["company"] = "No Company"
+        new_jobs.append(scraper.store_card_data(info))
+        seen_urls.add(job_url)
+    # One transaction (one fsync) per query rather than per job.
+    bulk_insert_jobs_minimal(conn, new_jobs)
+    for info in new_jobs:
+        logger.info("Inserted job from search: %s @ %s", info['title'], info['company'])
 
 if __name__ == "__main__":
     from jobfuq.utils.utils import load_config
     config = load_config('jobfuq/conf/config.toml')
-    asyncio.run(main(config))
\ No newline at end of file
+    run_async(main(config))
\ No newline at end of file
@@ -9,14 +9,13 @@ rechecks their status (including applicant count) using the scraper.py,
 and updates the database accordingly.
 """
 
-import asyncio
 import time
 import random
 import argparse
-from jobfuq.database.database import create_connection, load_blacklist
+from jobfuq.database.database import JobStatusWriter, create_connection, load_blacklist
 from jobfuq.scraper.core.scraper import LinkedInScraper
-from jobfuq.scraper.core.linked_utils import simulate_human_behavior, block_resources
-from jobfuq.utils.utils import load_config
+from jobfuq.scraper.core.linked_utils import launch_browser, simulate_human_behavior, block_resources_cdp
+from jobfuq.utils.utils import load_config, run_async
 from jobfuq.logger.logger import logger, set_verbose
 from playwright.async_api import async_playwright
 
@@ -45,37 +44,46 @@ async def update_old_job_listings():
 
     col_names = [desc[0] for desc in cursor.description]
     jobs = [dict(zip(col_names, row)) for row in rows]
-    logger.info(f"Found {len(jobs)} job listing(s) to update.")
+    logger.info("Found %s job listing(s) to update.", len(jobs))
 
-    async with async_playwright() as p:
-        headless = config.get("headless", True)
-        browser = await p.chromium.launch(headless=headless, slow_mo=50)
-        user_agents = config.get("user_agents", ["Mozilla/5.0"])
-        context = await browser.new_context(user_agent=random.choice(user_agents))
-        await context.route("**/*", block_resources)
-        page = await context.new_page()
-        await simulate_human_behavior(page)
+    try:
+        async with async_playwright() as p:
+            headless = config.get("headless", True)
+            browser = await launch_browser(p, headless)
+            user_agents = config.get("user_agents", ["Mozilla/5.0"])
+            context = await browser.new_context(user_agent=random.choice(user_agents))
+            page = await context.new_page()
+            await block_resources_cdp(page)
+            await simulate_human_behavior(page)
 
-        time_filter = config.get("time_filter", "2419200")
-        blacklist = load_blacklist(conn)
-        scraper = LinkedInScraper(config, time_filter, blacklist, playwright=p)
+            time_filter = config.get("time_filter", "2419200")
+            blacklist = load_blacklist(conn)
+            scraper = LinkedInScraper(config, time_filter, blacklist, playwright=p)
+            # Status rows are committed in batches rather than one transaction per job.
+            writer = JobStatusWriter(create_connection(config, check_same_thread=False))
 
-        for job in jobs:
-            job_url = job.get("job_url")
-            if not job_url:
-                logger.warning("Skipping a job with no job_url.")
-                continue
+            try:
+                for job in jobs:
+                    job_url = job.get("job_url")
+                    if not job_url:
+                        logger.warning("Skipping a job with no job_url.")
+                        continue
 
-            logger.info(f"Rechecking status for job: {job_url}")
-            updated = await scraper.update_existing_job(conn, job_url, page)
-            if updated:
-                state = updated.get("job_state", "UNKNOWN")
-                logger.info(f"Job {job_url} updated: state={state}")
-            else:
-                logger.error(f"Failed to update job: {job_url}")
+                    logger.info("Rechecking status for job: %s", job_url)
+                    updated = await scraper.update_existing_job(job_url, page)
+                    if updated:
+                        writer.put(updated)
+                        state = updated.get("job_state", "UNKNOWN")
+                        logger.info("Job %s updated: state=%s", job_url, state)
+                    else:
+                        logger.error("Failed to update job: %s", job_url)
+            finally:
+                await writer.close()
+                writer.conn.close()
 
-        await browser.close()
-    conn.close()
+            await browser.close()
+    finally:
+        conn.close()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -84,7 +92,7 @@ def main():
     parser.add_argument("-v", "--verbose", action="store_true", help="Increase output verbosity")
     args = parser.parse_args()
     set_verbose(args.verbose)
-    asyncio.run(update_old_job_listings())
+    run_async(update_old_job_listings())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
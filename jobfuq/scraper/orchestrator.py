@@ -10,14 +10,14 @@ The updated config (including time_filter from --hours) is passed to each flow.
 """
 
 import argparse
-import asyncio
 from jobfuq.logger.logger import set_verbose
-from jobfuq.utils.utils import load_config
+from jobfuq.utils.utils import load_config, run_async
 
 # Import the main functions from each flow module.
 from jobfuq.scraper.flows.search import main as search_main
 from jobfuq.scraper.flows.details import main as details_main
 from jobfuq.scraper.flows.update import main as update_main
+from jobfuq.scraper.core.browser_manager import BrowserManager
 
 async def orchestrate(args):
     config = load_config('jobfuq/conf/config.toml')
@@ -55,10 +55,15 @@ async def orchestrate(args):
 
     print(f"Running flows: {', '.join(sorted(flows_to_run))}")
 
-    if "search" in flows_to_run:
-        await search_main(config)
-    if "details" in flows_to_run:
-        await details_main(config)
+    # Search and details share one browser, and each account logs in once for both.
+    manager = BrowserManager(config)
+    try:
+        if "search" in flows_to_run:
+            await search_main(config, manager)
+        if "details" in flows_to_run:
+            await details_main(config, manager)
+    finally:
+        await manager.shutdown()
     if "update" in flows_to_run:
         await update_main(config)
 
@@ -73,7 +78,7 @@ def main():
     parser.add_argument('extra', nargs='*', help='Optional job URL for debug-single mode')
     parser.add_argument('--recipe', type=str, default="all", help='Recipe to run: search, details, update, or combinations like search+details')
     args = parser.parse_args()
-    asyncio.run(orchestrate(args))
+    run_async(orchestrate(args))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,12 +1,23 @@
 # jobfuq/utils.py
 
-from typing import Any, Dict
+from typing import Any, Awaitable, Dict, TypeVar, Union
+import asyncio
+import json
 import sys
 
+import tomllib  # Python 3.11+ is required (asyncio.Runner and TaskGroup as well).
+
 try:
-    import tomllib  # For Python 3.11+
+    import orjson
 except ImportError:
-    import tomli as tomllib  # For Python < 3.11
+    orjson = None  # Fall back to the stdlib json module.
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Fall back to the default asyncio event loop.
+
+T = TypeVar("T")
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
@@ -20,3 +31,40 @@ def load_config(config_path: str) -> Dict[str, Any]:
     """
     with open(config_path, "rb") as f:
         return tomllib.load(f)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON with orjson when available, otherwise with the stdlib.
+
+    Raises:
+        ValueError: If the input is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """
+    Encode to compact UTF-8 JSON bytes, or two-space indented with `indent`. The backends
+    agree only on str, int, bool and None values under str keys: floats are formatted
+    differently (1e+16 vs 1e16) and orjson rejects non-str keys, so stringify anything
+    that gets hashed.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_SORT_KEYS if sort_keys else 0) | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, sort_keys=sort_keys, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def run_async(main: Awaitable[T]) -> T:
+    """
+    Run an entry-point coroutine to completion, on a uvloop event loop when uvloop is
+    installed. Playwright and aiohttp traffic all passes through the loop, so its per-call
+    overhead adds up over a run.
+    """
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None) as runner:
+        return runner.run(main)
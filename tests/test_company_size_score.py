@@ -0,0 +1,32 @@
+import unittest
+
+import numpy as np
+
+from jobfuq.processing.processor import calculate_company_size_score
+from jobfuq.processing.score_kernel import company_size_score_vec
+
+
+class CompanySizeScoreTest(unittest.TestCase):
+    def test_size_buckets(self):
+        expected = {0: 50.0, 1: 45.0, 2: 40.0, 3: 100.0, 5: 100.0, 6: 80.0, 7: 60.0, 8: 40.0, 12: 40.0}
+        for size, score in expected.items():
+            self.assertEqual(calculate_company_size_score(size), score)
+
+    def test_negative_and_fractional_sizes(self):
+        self.assertEqual(calculate_company_size_score(-2), 60.0)
+        self.assertEqual(calculate_company_size_score(5.5), 22.5)
+        self.assertEqual(calculate_company_size_score(2.5), 37.5)
+        self.assertEqual(calculate_company_size_score(4.0), 100.0)
+
+    def test_non_numeric_sizes_score_zero(self):
+        self.assertEqual(calculate_company_size_score(None), 0.0)
+        self.assertEqual(calculate_company_size_score("Unknown"), 0.0)
+
+    def test_vector_kernel_matches_scalar(self):
+        sizes = np.arange(-4, 12, dtype=np.int64)
+        scores = company_size_score_vec(sizes)
+        self.assertEqual(scores.tolist(), [calculate_company_size_score(int(s)) for s in sizes])
+
+
+if __name__ == "__main__":
+    unittest.main()
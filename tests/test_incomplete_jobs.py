@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+from jobfuq.database.database import (
+    bulk_insert_jobs_minimal, bulk_update_job_details, create_connection, create_table, get_incomplete_jobs
+)
+
+
+def card(job_id, **fields):
+    job = {
+        "title": "DevOps Engineer",
+        "company": "Acme",
+        "location": "Remote",
+        "description": "Run our CI/CD pipelines.",
+        "applicants_count": 12,
+        "job_url": f"https://www.linkedin.com/jobs/view/{job_id}/",
+    }
+    job.update(fields)
+    return job
+
+
+class IncompleteJobsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.conn = create_connection({"db_path": os.path.join(self.tmp.name, "jobs.db")})
+        create_table(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def selected_urls(self):
+        return {job["job_url"] for job in get_incomplete_jobs(self.conn)}
+
+    def test_complete_card_skips_detail_page(self):
+        complete = card(1)
+        missing_applicants = card(2, applicants_count=None)
+        missing_company = card(3, company="No Company")
+        missing_description = card(4, description="")
+        bulk_insert_jobs_minimal(self.conn, [complete, missing_applicants, missing_company, missing_description])
+        self.assertEqual(
+            self.selected_urls(),
+            {missing_applicants["job_url"], missing_company["job_url"], missing_description["job_url"]},
+        )
+
+    def test_visited_job_is_not_selected_again(self):
+        job = card(5, applicants_count=None)
+        bulk_insert_jobs_minimal(self.conn, [job])
+        self.assertEqual(self.selected_urls(), {job["job_url"]})
+        # The detail page had no applicants count either; one visit is enough.
+        bulk_update_job_details(self.conn, [{
+            **job, "company_url": "", "remote_allowed": False, "job_state": "ACTIVE", "company_size": "Unknown",
+            "company_size_score": 0, "date": "2026-10-15", "listed_at": 0, "overall_relevance": 0.0,
+            "is_posted": 1, "application_status": "not applied",
+        }])
+        self.assertEqual(self.selected_urls(), set())
+
+    def test_details_without_a_date_keep_the_posting_date(self):
+        job = card(6, applicants_count=None, date="2026-09-01", listed_at=1000)
+        bulk_insert_jobs_minimal(self.conn, [job])
+        bulk_update_job_details(self.conn, [{
+            **job, "company_url": "", "remote_allowed": False, "job_state": "ACTIVE", "company_size": "Unknown",
+            "company_size_score": 0, "date": None, "listed_at": None, "overall_relevance": 0.0,
+            "is_posted": 1, "application_status": "not applied",
+        }])
+        row = self.conn.execute("SELECT date, listed_at FROM job_listings WHERE job_url = ?", (job["job_url"],))
+        self.assertEqual(row.fetchone(), ("2026-09-01", 1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
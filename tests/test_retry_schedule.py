@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from jobfuq.database.database import (
+    bulk_insert_jobs_minimal, create_candidate_tables, create_connection, create_table, get_retry_counts
+)
+from jobfuq.processing.processor import MAX_RETRY_ATTEMPTS, schedule_retry
+
+
+class RetryScheduleTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.conn = create_connection({"db_path": os.path.join(self.tmp.name, "jobs.db")})
+        create_table(self.conn)
+        create_candidate_tables(self.conn)
+        bulk_insert_jobs_minimal(self.conn, [{"title": "SRE", "job_url": "https://www.linkedin.com/jobs/view/1/"}])
+        self.job_id = self.conn.execute("SELECT id FROM job_listings").fetchone()[0]
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def poisoned(self):
+        return self.conn.execute("SELECT COUNT(*) FROM poison_jobs WHERE job_id = ?", (self.job_id,)).fetchone()[0] > 0
+
+    def test_rate_limit_streak_never_poisons(self):
+        for _ in range(MAX_RETRY_ATTEMPTS * 3):
+            schedule_retry(self.conn, self.job_id, "429 Too Many Requests", transient=True)
+        self.assertFalse(self.poisoned())
+        self.assertEqual(get_retry_counts(self.conn, self.job_id), (MAX_RETRY_ATTEMPTS * 3, 0))
+
+    def test_only_non_transient_failures_count_toward_poisoning(self):
+        for _ in range(MAX_RETRY_ATTEMPTS):
+            schedule_retry(self.conn, self.job_id, "429 Too Many Requests", transient=True)
+            schedule_retry(self.conn, self.job_id, "no evaluation")
+        self.assertFalse(self.poisoned())
+        schedule_retry(self.conn, self.job_id, "no evaluation")
+        self.assertTrue(self.poisoned())
+
+
+if __name__ == "__main__":
+    unittest.main()